@@ -7,147 +7,147 @@ Copyright (c) 2024-2026 HollowTheSilver - https://github.com/HollowTheSilver
 # // ========================================( Modules )======================================== // #
 
 
+import importlib.util as _importlib_util
 import logging as _logging
+from typing import TYPE_CHECKING
 
-_logging.getLogger(__name__).addHandler(_logging.NullHandler())
-
-from .components.base import DynamicPersistentButton, StatefulButton, StatefulSelect
-from .components.buttons import (
-    DangerButton,
-    LinkButton,
-    PrimaryButton,
-    SecondaryButton,
-    SuccessButton,
-    ToggleButton,
-)
-from .components.inputs import Checkbox, CheckboxGroup, FileUpload, Modal, RadioGroup, TextInput
-from .components.patterns import (
-    Choice,
-    Collapsible,
-    ConfirmationButtons,
-    EmojiGrid,
-    PaginatedRegion,
-    PaginationControls,
-    ProgressBar,
-    ToggleGroup,
-    action_section,
-    alert,
-    button_grid,
-    button_row,
-    card,
-    choice_row,
-    confirm_section,
-    cycle_button,
-    divider,
-    emoji_grid,
-    file_attachment,
-    gallery,
-    gap,
-    image_section,
-    key_value,
-    link_section,
-    progress_bar,
-    stats_card,
-    tab_nav,
-    toggle_button,
-    toggle_section,
-)
-from .components.selects import (
-    ChannelSelect,
-    Dropdown,
-    MentionableSelect,
-    RoleSelect,
-    UserSelect,
-)
-from .components.types import MAX_SELECT_OPTIONS, EmojiInput, MediaInput
-from .components.v1_composition import CompositeComponent, get_component, register_component
-from .components.wrappers import with_confirmation, with_cooldown, with_loading_state
-from .devtools import DevToolsCog, InspectorView
-
-# Then import other components that might need the store
-from .exceptions import (
-    InstanceLimitError,
-    PersistenceConfigError,
-    PersistenceError,
-    PersistenceInitError,
-    PersistenceRehydrateError,
-    PersistenceSchemaError,
-)
-from .persistence import (
-    ApplicationPersistence,
-    Capability,
-    InMemoryBackend,
-    PersistenceBackend,
-    PersistenceManager,
-    RegistryPersistence,
-    SlotPolicy,
-)
-from .persistence import __all__ as _persistence_all
-from .persistence import (
-    register_kwargs_migrator,
-    register_migrator,
-)
-from .setup import setup_middleware
-from .state.actions import ActionCreators
-from .state.computed import ComputedValue, computed
-from .state.middleware import LoggingMiddleware, PersistenceMiddleware, UndoMiddleware
+from .utils.lazy import lazy_exports as _lazy_exports
 
-# Import singleton early to ensure it's available
-from .state.singleton import get_store
-from .state.slots import access_slot, read_slot, slot_property
-from .state.store import StateStore
-from .state.types import StateData
-from .theming.context import get_current_theme
-from .theming.core import Theme, get_default_theme, get_theme, register_theme, set_default_theme
-from .theming.themes import dark_theme, default_theme, light_theme
-from .utils.decorators import cascade_component, cascade_reducer
-from .utils.errors import safe_execute, with_error_boundary, with_retry
-from .utils.fetch import fetch_as_file
-from .utils.logging import setup_logging
-from .utils.strings import is_emoji, slugify
-from .utils.tasks import get_task_manager
-from .validation import (
-    ValidationResult,
-    choices,
-    emoji,
-    max_length,
-    max_value,
-    min_length,
-    min_value,
-    regex,
-    validate_field,
-    validate_fields,
-)
-from .views.layout import DisplayLayoutView, StatefulLayoutView
-from .views.patterns import (
-    FormLayoutView,
-    FormView,
-    LeaderboardLayoutView,
-    MenuLayoutView,
-    MenuView,
-    PaginatedLayoutView,
-    PaginatedView,
-    PersistentLeaderboardLayoutView,
-    PersistentRolesLayoutView,
-    RolesLayoutView,
-    TabLayoutView,
-    TabView,
-    WizardLayoutView,
-    WizardView,
-)
-from .views.patterns.types import (
-    FormField,
-    FormSchema,
-    RoleCategory,
-    WizardSchema,
-    WizardStep,
-)
-from .views.persistent import PersistentLayoutView, PersistentView
-from .views.view import StatefulView
+_logging.getLogger(__name__).addHandler(_logging.NullHandler())
 
-# Optional backend -- only present when aiosqlite is installed
-if "SQLiteBackend" in _persistence_all:
-    from .persistence import SQLiteBackend  # noqa: F401
+if TYPE_CHECKING:
+    from .components.base import DynamicPersistentButton, StatefulButton, StatefulSelect
+    from .components.buttons import (
+        DangerButton,
+        LinkButton,
+        PrimaryButton,
+        SecondaryButton,
+        SuccessButton,
+        ToggleButton,
+    )
+    from .components.inputs import Checkbox, CheckboxGroup, FileUpload, Modal, RadioGroup, TextInput
+    from .components.patterns import (
+        Choice,
+        Collapsible,
+        ConfirmationButtons,
+        EmojiGrid,
+        PaginatedRegion,
+        PaginationControls,
+        ProgressBar,
+        ToggleGroup,
+        action_section,
+        alert,
+        button_grid,
+        button_row,
+        card,
+        choice_row,
+        confirm_section,
+        cycle_button,
+        divider,
+        emoji_grid,
+        file_attachment,
+        gallery,
+        gap,
+        image_section,
+        key_value,
+        link_section,
+        progress_bar,
+        stats_card,
+        tab_nav,
+        toggle_button,
+        toggle_section,
+    )
+    from .components.selects import (
+        ChannelSelect,
+        Dropdown,
+        MentionableSelect,
+        RoleSelect,
+        UserSelect,
+    )
+    from .components.types import MAX_SELECT_OPTIONS, EmojiInput, MediaInput
+    from .components.v1_composition import (
+        CompositeComponent,
+        freeze_registry,
+        get_component,
+        register_component,
+    )
+    from .components.wrappers import with_confirmation, with_cooldown, with_loading_state
+    from .devtools import DevToolsCog, InspectorView
+    from .exceptions import (
+        InstanceLimitError,
+        PersistenceConfigError,
+        PersistenceError,
+        PersistenceInitError,
+        PersistenceRehydrateError,
+        PersistenceSchemaError,
+    )
+    from .persistence import (
+        ApplicationPersistence,
+        Capability,
+        InMemoryBackend,
+        PersistenceBackend,
+        PersistenceManager,
+        RegistryPersistence,
+        SlotPolicy,
+        SQLiteBackend,
+        register_kwargs_migrator,
+        register_migrator,
+    )
+    from .setup import setup_middleware
+    from .state.actions import ActionCreators
+    from .state.computed import ComputedValue, computed
+    from .state.middleware import LoggingMiddleware, PersistenceMiddleware, UndoMiddleware
+    from .state.singleton import get_store
+    from .state.slots import access_slot, read_slot, slot_property
+    from .state.store import StateStore
+    from .state.types import StateData
+    from .theming.context import get_current_theme
+    from .theming.core import Theme, get_default_theme, get_theme, register_theme, set_default_theme
+    from .theming.themes import dark_theme, default_theme, light_theme
+    from .utils.decorators import cascade_component, cascade_reducer
+    from .utils.errors import safe_execute, with_error_boundary, with_retry
+    from .utils.fetch import fetch_as_file
+    from .utils.logging import setup_logging
+    from .utils.strings import is_emoji, slugify
+    from .utils.tasks import get_task_manager
+    from .validation import (
+        ValidationResult,
+        choices,
+        emoji,
+        max_length,
+        max_value,
+        min_length,
+        min_value,
+        regex,
+        validate_field,
+        validate_fields,
+    )
+    from .views.layout import DisplayLayoutView, StatefulLayoutView
+    from .views.patterns import (
+        FormLayoutView,
+        FormView,
+        LeaderboardLayoutView,
+        MenuLayoutView,
+        MenuView,
+        PaginatedLayoutView,
+        PaginatedView,
+        PersistentLeaderboardLayoutView,
+        PersistentRolesLayoutView,
+        RolesLayoutView,
+        TabLayoutView,
+        TabView,
+        WizardLayoutView,
+        WizardView,
+    )
+    from .views.patterns.types import (
+        FormField,
+        FormSchema,
+        RoleCategory,
+        WizardSchema,
+        WizardStep,
+    )
+    from .views.persistent import PersistentLayoutView, PersistentView
+    from .views.view import StatefulView
 
 # // ========================================( Script )======================================== // #
 
@@ -217,6 +217,7 @@ __all__ = [
     "ProgressBar",
     "register_component",
     "get_component",
+    "freeze_registry",
     # Input Components
     "TextInput",
     "Checkbox",
@@ -328,5 +329,162 @@ __all__ = [
     "DevToolsCog",
 ]
 
-if "SQLiteBackend" in _persistence_all:
+# Optional backend -- only present when aiosqlite is installed
+if _importlib_util.find_spec("aiosqlite") is not None:
     __all__.append("SQLiteBackend")
+
+# Public name -> defining module. Submodules are imported on first attribute
+# access so ``import cascadeui`` stays cheap for callers that only need a
+# handful of names.
+__getattr__, __dir__ = _lazy_exports(
+    __name__,
+    {
+        ".components.base": ("DynamicPersistentButton", "StatefulButton", "StatefulSelect"),
+        ".components.buttons": (
+            "DangerButton",
+            "LinkButton",
+            "PrimaryButton",
+            "SecondaryButton",
+            "SuccessButton",
+            "ToggleButton",
+        ),
+        ".components.inputs": (
+            "Checkbox",
+            "CheckboxGroup",
+            "FileUpload",
+            "Modal",
+            "RadioGroup",
+            "TextInput",
+        ),
+        ".components.patterns.v1": (
+            "ConfirmationButtons",
+            "PaginationControls",
+            "ProgressBar",
+            "ToggleGroup",
+        ),
+        ".components.patterns.v2": (
+            "Choice",
+            "Collapsible",
+            "EmojiGrid",
+            "PaginatedRegion",
+            "action_section",
+            "alert",
+            "button_grid",
+            "button_row",
+            "card",
+            "choice_row",
+            "confirm_section",
+            "cycle_button",
+            "divider",
+            "emoji_grid",
+            "file_attachment",
+            "gallery",
+            "gap",
+            "image_section",
+            "key_value",
+            "link_section",
+            "progress_bar",
+            "stats_card",
+            "tab_nav",
+            "toggle_button",
+            "toggle_section",
+        ),
+        ".components.selects": (
+            "ChannelSelect",
+            "Dropdown",
+            "MentionableSelect",
+            "RoleSelect",
+            "UserSelect",
+        ),
+        ".components.types": ("MAX_SELECT_OPTIONS", "EmojiInput", "MediaInput"),
+        ".components.v1_composition": (
+            "CompositeComponent",
+            "freeze_registry",
+            "get_component",
+            "register_component",
+        ),
+        ".components.wrappers": ("with_confirmation", "with_cooldown", "with_loading_state"),
+        ".devtools": ("DevToolsCog", "InspectorView"),
+        ".exceptions": (
+            "InstanceLimitError",
+            "PersistenceConfigError",
+            "PersistenceError",
+            "PersistenceInitError",
+            "PersistenceRehydrateError",
+            "PersistenceSchemaError",
+        ),
+        ".persistence": (
+            "ApplicationPersistence",
+            "Capability",
+            "InMemoryBackend",
+            "PersistenceBackend",
+            "PersistenceManager",
+            "RegistryPersistence",
+            "SlotPolicy",
+            "SQLiteBackend",
+            "register_kwargs_migrator",
+            "register_migrator",
+        ),
+        ".setup": ("setup_middleware",),
+        ".state.actions": ("ActionCreators",),
+        ".state.computed": ("ComputedValue", "computed"),
+        ".state.middleware": ("LoggingMiddleware", "PersistenceMiddleware", "UndoMiddleware"),
+        ".state.singleton": ("get_store",),
+        ".state.slots": ("access_slot", "read_slot", "slot_property"),
+        ".state.store": ("StateStore",),
+        ".state.types": ("StateData",),
+        ".theming.context": ("get_current_theme",),
+        ".theming.core": (
+            "Theme",
+            "get_default_theme",
+            "get_theme",
+            "register_theme",
+            "set_default_theme",
+        ),
+        ".theming.themes": ("dark_theme", "default_theme", "light_theme"),
+        ".utils.decorators": ("cascade_component", "cascade_reducer"),
+        ".utils.errors": ("safe_execute", "with_error_boundary", "with_retry"),
+        ".utils.fetch": ("fetch_as_file",),
+        ".utils.logging": ("setup_logging",),
+        ".utils.strings": ("is_emoji", "slugify"),
+        ".utils.tasks": ("get_task_manager",),
+        ".validation": (
+            "ValidationResult",
+            "choices",
+            "emoji",
+            "max_length",
+            "max_value",
+            "min_length",
+            "min_value",
+            "regex",
+            "validate_field",
+            "validate_fields",
+        ),
+        ".views.layout": ("DisplayLayoutView", "StatefulLayoutView"),
+        ".views.patterns": (
+            "FormLayoutView",
+            "FormView",
+            "LeaderboardLayoutView",
+            "MenuLayoutView",
+            "MenuView",
+            "PaginatedLayoutView",
+            "PaginatedView",
+            "PersistentLeaderboardLayoutView",
+            "PersistentRolesLayoutView",
+            "RolesLayoutView",
+            "TabLayoutView",
+            "TabView",
+            "WizardLayoutView",
+            "WizardView",
+        ),
+        ".views.patterns.types": (
+            "FormField",
+            "FormSchema",
+            "RoleCategory",
+            "WizardSchema",
+            "WizardStep",
+        ),
+        ".views.persistent": ("PersistentLayoutView", "PersistentView"),
+        ".views.view": ("StatefulView",),
+    },
+)
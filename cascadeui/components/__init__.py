@@ -1,44 +1,57 @@
 # // ========================================( Modules )======================================== // #
 
 
+from typing import TYPE_CHECKING
+
+from ..utils.lazy import lazy_exports
+
+# The stateful bases are imported eagerly: nearly every other export
+# subclasses them, so deferring them would only move the cost.
 from .base import StatefulButton, StatefulComponent, StatefulSelect
-from .buttons import (
-    DangerButton,
-    LinkButton,
-    PrimaryButton,
-    SecondaryButton,
-    SuccessButton,
-    ToggleButton,
-)
-from .inputs import Checkbox, CheckboxGroup, FileUpload, Modal, RadioGroup, TextInput
-from .patterns import (
-    ConfirmationButtons,
-    PaginationControls,
-    ProgressBar,
-    ToggleGroup,
-    action_section,
-    alert,
-    button_row,
-    card,
-    confirm_section,
-    cycle_button,
-    divider,
-    file_attachment,
-    gallery,
-    gap,
-    image_section,
-    key_value,
-    link_section,
-    progress_bar,
-    stats_card,
-    tab_nav,
-    toggle_button,
-    toggle_section,
-)
-from .selects import ChannelSelect, Dropdown, MentionableSelect, RoleSelect, UserSelect
-from .types import EmojiInput, MediaInput
-from .v1_composition import CompositeComponent, get_component, register_component
-from .wrappers import with_confirmation, with_cooldown, with_loading_state
+
+if TYPE_CHECKING:
+    from .buttons import (
+        DangerButton,
+        LinkButton,
+        PrimaryButton,
+        SecondaryButton,
+        SuccessButton,
+        ToggleButton,
+    )
+    from .inputs import Checkbox, CheckboxGroup, FileUpload, Modal, RadioGroup, TextInput
+    from .patterns import (
+        ConfirmationButtons,
+        PaginationControls,
+        ProgressBar,
+        ToggleGroup,
+        action_section,
+        alert,
+        button_row,
+        card,
+        confirm_section,
+        cycle_button,
+        divider,
+        file_attachment,
+        gallery,
+        gap,
+        image_section,
+        key_value,
+        link_section,
+        progress_bar,
+        stats_card,
+        tab_nav,
+        toggle_button,
+        toggle_section,
+    )
+    from .selects import ChannelSelect, Dropdown, MentionableSelect, RoleSelect, UserSelect
+    from .types import EmojiInput, MediaInput
+    from .v1_composition import (
+        CompositeComponent,
+        freeze_registry,
+        get_component,
+        register_component,
+    )
+    from .wrappers import with_confirmation, with_cooldown, with_loading_state
 
 # // ========================================( Script )======================================== // #
 
@@ -72,6 +85,7 @@ __all__ = [
     "CompositeComponent",
     "register_component",
     "get_component",
+    "freeze_registry",
     "ConfirmationButtons",
     "PaginationControls",
     "ToggleGroup",
@@ -108,3 +122,55 @@ __all__ = [
     "EmojiInput",
     "MediaInput",
 ]
+
+# Everything past the bases resolves on first access, so importing
+# ``PrimaryButton`` does not also load the selects, inputs, and patterns.
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".buttons": (
+            "DangerButton",
+            "LinkButton",
+            "PrimaryButton",
+            "SecondaryButton",
+            "SuccessButton",
+            "ToggleButton",
+        ),
+        ".inputs": ("Checkbox", "CheckboxGroup", "FileUpload", "Modal", "RadioGroup", "TextInput"),
+        ".patterns.v1": (
+            "ConfirmationButtons",
+            "PaginationControls",
+            "ProgressBar",
+            "ToggleGroup",
+        ),
+        ".patterns.v2": (
+            "action_section",
+            "alert",
+            "button_row",
+            "card",
+            "confirm_section",
+            "cycle_button",
+            "divider",
+            "file_attachment",
+            "gallery",
+            "gap",
+            "image_section",
+            "key_value",
+            "link_section",
+            "progress_bar",
+            "stats_card",
+            "tab_nav",
+            "toggle_button",
+            "toggle_section",
+        ),
+        ".selects": ("ChannelSelect", "Dropdown", "MentionableSelect", "RoleSelect", "UserSelect"),
+        ".types": ("EmojiInput", "MediaInput"),
+        ".v1_composition": (
+            "CompositeComponent",
+            "freeze_registry",
+            "get_component",
+            "register_component",
+        ),
+        ".wrappers": ("with_confirmation", "with_cooldown", "with_loading_state"),
+    },
+)
@@ -3,6 +3,7 @@
 
 import inspect
 import logging
+from operator import attrgetter
 from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Union
 
 import discord
@@ -15,12 +16,28 @@ from ..utils.coercion import coerce_snowflake_match
 logger = logging.getLogger(__name__)
 
 
+# // ========================================( Functions )======================================== // #
+
+
+def _button_value(component) -> bool:
+    """Buttons carry no value of their own; a click dispatches ``True``."""
+    return True
+
+
+def _no_value(component) -> None:
+    return None
+
+
 # // ========================================( Classes )======================================== // #
 
 
 class StatefulComponent:
     """Base mixin for components that interact with state."""
 
+    # Empty so slotted subclasses (``TextInput``) stay dict-free; classes
+    # that also inherit a discord.py ``Item`` keep their ``__dict__``.
+    __slots__ = ()
+
     def create_stateful_callback(self, component, original_callback=None):
         """Create a callback that updates state."""
         component_id = getattr(component, "custom_id", None) or str(id(component))
@@ -41,6 +58,22 @@ class StatefulComponent:
             except (ValueError, TypeError):
                 _pass_values = False
 
+        # Pick the value accessor once -- which attribute carries the value
+        # is fixed by the component's type, so the per-click path is a
+        # single call instead of a hasattr/isinstance cascade.
+        if hasattr(component, "value"):
+            get_value = attrgetter("value")
+        elif hasattr(component, "values"):
+            get_value = attrgetter("values")
+        elif isinstance(component, discord.ui.Button):
+            get_value = _button_value
+        else:
+            get_value = _no_value
+
+        # Resolved once per callback rather than through the class
+        # attribute on every click.
+        component_interaction = ActionCreators.component_interaction
+
         async def stateful_callback(interaction):
             # Get view from the component itself
             view = component.view
@@ -53,6 +86,8 @@ class StatefulComponent:
                     return await original_callback(interaction)
                 return
 
+            user_id = interaction.user.id
+
             # Per-component owner-only gate. Routes through the view's
             # ``on_unauthorized`` hook + ``unauthorized_message`` so the
             # rejection UX matches the view-level gate. Skipped when the
@@ -75,19 +110,12 @@ class StatefulComponent:
             if (
                 getattr(component, "_button_owner_only", False) is True
                 and getattr(view, "user_id", None) is not None
-                and interaction.user.id != view.user_id
+                and user_id != view.user_id
             ):
                 await view.on_unauthorized(interaction)
                 return
 
-            # Get component value
-            value = None
-            if hasattr(component, "value"):
-                value = component.value
-            elif hasattr(component, "values"):
-                value = component.values
-            elif isinstance(component, discord.ui.Button):
-                value = True
+            value = get_value(component)
 
             # Bind the live interaction for the acting-view fast path in
             # ``_StatefulMixin.refresh()``. Scope-narrow: set for the original
@@ -109,10 +137,10 @@ class StatefulComponent:
                     return
 
                 # Then dispatch state update (may trigger on_state_changed on views)
-                payload = ActionCreators.component_interaction(
+                payload = component_interaction(
                     component_id=component_id,
                     view_id=view.id,
-                    user_id=interaction.user.id,
+                    user_id=user_id,
                     value=value,
                 )
                 await view.dispatch("COMPONENT_INTERACTION", payload)
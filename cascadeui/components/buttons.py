@@ -9,6 +9,10 @@ from discord import ButtonStyle, Interaction
 from ..state.actions import ActionCreators
 from .base import StatefulButton
 
+# ToggleButton styles, resolved once instead of per toggle
+_STYLE_ON = ButtonStyle.success
+_STYLE_OFF = ButtonStyle.secondary
+
 # // ========================================( Classes )======================================== // #
 
 
@@ -69,46 +73,49 @@ class ToggleButton(StatefulButton):
 
         # Set initial style
         if toggled:
-            kwargs.setdefault("style", ButtonStyle.success)
+            kwargs.setdefault("style", _STYLE_ON)
             current_label = self.toggled_label
         else:
-            kwargs.setdefault("style", ButtonStyle.secondary)
+            kwargs.setdefault("style", _STYLE_OFF)
             current_label = self.original_label
 
         # Create the button
         super().__init__(label=current_label, **kwargs)
 
-        # Store original callback and create toggle wrapper
+        # Store original callback; toggling itself lives in ``callback``
         self.user_callback = callback
-        self.callback = self._create_toggle_callback()
-
-    def _create_toggle_callback(self):
-        """Create a callback that handles toggling."""
-
-        async def toggle_callback(interaction: Interaction):
-            # Toggle state
-            self.is_toggled = not self.is_toggled
-
-            # Update button appearance
-            self.label = self.toggled_label if self.is_toggled else self.original_label
-            self.style = ButtonStyle.success if self.is_toggled else ButtonStyle.secondary
-
-            # Dispatch state update using public .view property from discord.ui.Item
-            view = self.view
-            if view and hasattr(view, "dispatch"):
-                component_id = getattr(self, "custom_id", None) or str(id(self))
-                payload = ActionCreators.component_interaction(
-                    component_id=component_id,
-                    view_id=view.id,
-                    user_id=interaction.user.id,
-                    value=self.is_toggled,
-                )
-                await view.dispatch("COMPONENT_INTERACTION", payload)
-
-            # Call user callback if provided
-            if self.user_callback:
-                await self.user_callback(interaction)
-            elif not interaction.response.is_done():
-                await interaction.response.defer()
-
-        return toggle_callback
+
+    async def callback(self, interaction: Interaction):
+        """Flip the toggle, dispatch the new state, then run the user callback.
+
+        Defined as a method rather than a per-instance closure so every
+        ToggleButton shares one function object.
+        """
+        # Toggle state
+        is_toggled = self.is_toggled = not self.is_toggled
+
+        # Update button appearance
+        if is_toggled:
+            self.label = self.toggled_label
+            self.style = _STYLE_ON
+        else:
+            self.label = self.original_label
+            self.style = _STYLE_OFF
+
+        # Dispatch state update using public .view property from discord.ui.Item
+        view = self.view
+        if view and hasattr(view, "dispatch"):
+            component_id = getattr(self, "custom_id", None) or str(id(self))
+            payload = ActionCreators.component_interaction(
+                component_id=component_id,
+                view_id=view.id,
+                user_id=interaction.user.id,
+                value=is_toggled,
+            )
+            await view.dispatch("COMPONENT_INTERACTION", payload)
+
+        # Call user callback if provided
+        if self.user_callback:
+            await self.user_callback(interaction)
+        elif not interaction.response.is_done():
+            await interaction.response.defer()
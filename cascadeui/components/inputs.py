@@ -2,6 +2,8 @@
 
 
 import logging
+from functools import lru_cache
+from operator import attrgetter
 from typing import Any, Callable, Dict, List, Optional, Union
 
 import discord
@@ -13,6 +15,21 @@ from .base import StatefulComponent
 
 logger = logging.getLogger(__name__)
 
+
+# // ========================================( Functions )======================================== // #
+
+
+@lru_cache(maxsize=256)
+def _input_slug(label: str) -> str:
+    """Memoized ``input_{slugify(label)}``.
+
+    Forms are rebuilt per interaction with the same handful of labels, so
+    the regex-backed slug is computed once per label instead of once per
+    construction.
+    """
+    return f"input_{slugify(label)}"
+
+
 # // ========================================( Classes )======================================== // #
 
 
@@ -44,6 +61,23 @@ class TextInput(StatefulComponent):
         through the grouped text-edit modal.
     """
 
+    # ``__dict__`` stays in the slots so callers can still hang their own
+    # attributes on a field; CPython only allocates it on first use.
+    __slots__ = (
+        "__dict__",
+        "label",
+        "description",
+        "placeholder",
+        "default",
+        "required",
+        "min_length",
+        "max_length",
+        "style",
+        "validators",
+        "custom_id",
+        "value",
+    )
+
     def __init__(
         self,
         label: str,
@@ -81,7 +115,7 @@ class TextInput(StatefulComponent):
         the one safe lowercase-alphanumeric derivation the rest of the
         library uses.
         """
-        return f"input_{slugify(label)}"
+        return _input_slug(label)
 
     def create_discord_component(self):
         """Build a ``ui.Label`` wrapping the inner ``ui.TextInput``."""
@@ -349,6 +383,34 @@ class FileUpload(StatefulComponent):
 _WRAPPED_INPUT_TYPES = (TextInput, Checkbox, CheckboxGroup, RadioGroup, FileUpload)
 
 
+# Submitted-value accessor per discord.py input type. ``on_submit`` looks
+# the child's concrete type up here instead of walking an isinstance chain
+# for every field; subclasses and unknown items are resolved once through
+# ``_submitted_value_getter`` and memoized under their own type.
+_SUBMITTED_VALUE_GETTERS: Dict[type, Optional[Callable]] = {
+    discord.ui.TextInput: attrgetter("value"),
+    discord.ui.RadioGroup: attrgetter("value"),
+    discord.ui.Checkbox: attrgetter("value"),
+    discord.ui.CheckboxGroup: attrgetter("values"),
+    discord.ui.FileUpload: attrgetter("values"),
+}
+
+
+def _submitted_value_getter(cls: type) -> Optional[Callable]:
+    """Return the value accessor for a modal child type, or ``None`` if it carries none."""
+    try:
+        return _SUBMITTED_VALUE_GETTERS[cls]
+    except KeyError:
+        pass
+    getter = None
+    for base, base_getter in list(_SUBMITTED_VALUE_GETTERS.items()):
+        if base_getter is not None and issubclass(cls, base):
+            getter = base_getter
+            break
+    _SUBMITTED_VALUE_GETTERS[cls] = getter
+    return getter
+
+
 def _unwrap_label(item):
     """Return the inner component of a ``ui.Label`` or pass through.
 
@@ -464,12 +526,9 @@ class Modal(discord.ui.Modal, StatefulComponent):
         values = {}
         for child in self.children:
             inner = _unwrap_label(child)
-            if isinstance(inner, (discord.ui.TextInput, discord.ui.RadioGroup)):
-                values[inner.custom_id] = inner.value
-            elif isinstance(inner, (discord.ui.CheckboxGroup, discord.ui.FileUpload)):
-                values[inner.custom_id] = inner.values
-            elif isinstance(inner, discord.ui.Checkbox):
-                values[inner.custom_id] = inner.value
+            get_value = _submitted_value_getter(type(inner))
+            if get_value is not None:
+                values[inner.custom_id] = get_value(inner)
 
         # Write submitted values back onto the original CascadeUI wrapper
         # instances so callers can read ``.value`` / ``.values`` directly
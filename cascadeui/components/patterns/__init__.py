@@ -1,34 +1,39 @@
 # // ========================================( Modules )======================================== // #
 
 
-from .v1 import ConfirmationButtons, PaginationControls, ProgressBar, ToggleGroup
-from .v2 import (
-    Choice,
-    Collapsible,
-    EmojiGrid,
-    PaginatedRegion,
-    action_section,
-    alert,
-    button_grid,
-    button_row,
-    card,
-    choice_row,
-    confirm_section,
-    cycle_button,
-    divider,
-    emoji_grid,
-    file_attachment,
-    gallery,
-    gap,
-    image_section,
-    key_value,
-    link_section,
-    progress_bar,
-    stats_card,
-    tab_nav,
-    toggle_button,
-    toggle_section,
-)
+from typing import TYPE_CHECKING
+
+from ...utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .v1 import ConfirmationButtons, PaginationControls, ProgressBar, ToggleGroup
+    from .v2 import (
+        Choice,
+        Collapsible,
+        EmojiGrid,
+        PaginatedRegion,
+        action_section,
+        alert,
+        button_grid,
+        button_row,
+        card,
+        choice_row,
+        confirm_section,
+        cycle_button,
+        divider,
+        emoji_grid,
+        file_attachment,
+        gallery,
+        gap,
+        image_section,
+        key_value,
+        link_section,
+        progress_bar,
+        stats_card,
+        tab_nav,
+        toggle_button,
+        toggle_section,
+    )
 
 # // ========================================( Script )======================================== // #
 
@@ -75,3 +80,44 @@ __all__ = [
     "emoji_grid",
     "button_grid",
 ]
+
+# V1 composites and V2 builders live in separate modules; loading one family
+# does not pull in the other.
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".v1": (
+            "ConfirmationButtons",
+            "PaginationControls",
+            "ProgressBar",
+            "ToggleGroup",
+        ),
+        ".v2": (
+            "Choice",
+            "Collapsible",
+            "EmojiGrid",
+            "PaginatedRegion",
+            "action_section",
+            "alert",
+            "button_grid",
+            "button_row",
+            "card",
+            "choice_row",
+            "confirm_section",
+            "cycle_button",
+            "divider",
+            "emoji_grid",
+            "file_attachment",
+            "gallery",
+            "gap",
+            "image_section",
+            "key_value",
+            "link_section",
+            "progress_bar",
+            "stats_card",
+            "tab_nav",
+            "toggle_button",
+            "toggle_section",
+        ),
+    },
+)
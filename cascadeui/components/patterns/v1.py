@@ -111,6 +111,9 @@ class PaginationControls(CompositeComponent):
 
     def _update_buttons(self) -> None:
         """Update button states based on current page."""
+        # ``page_count`` may have been reassigned below the current page;
+        # clamp the same way ``__init__`` does so the label stays valid.
+        self.current_page = min(max(0, self.current_page), self.page_count - 1)
         self.prev_button.disabled = self.current_page == 0
         self.next_button.disabled = self.current_page == self.page_count - 1
         self.indicator.label = f"Page {self.current_page + 1}/{self.page_count}"
@@ -87,6 +87,25 @@ def _wrap_mentionable_defaults(
     return out
 
 
+# // ========================================( Option Helpers )======================================== // #
+
+
+def _option_from_dict(opt: Dict[str, Any]) -> SelectOption:
+    """Build a ``SelectOption`` from the dict shorthand ``Dropdown`` accepts.
+
+    ``value`` falls back to the resolved label, so ``{"label": "Red"}``
+    yields ``value="Red"`` and a bare ``{}`` yields ``"Option"`` for both.
+    """
+    label = opt.get("label", "Option")
+    return SelectOption(
+        label=label,
+        value=opt.get("value", label),
+        description=opt.get("description"),
+        emoji=opt.get("emoji"),
+        default=opt.get("default", False),
+    )
+
+
 # // ========================================( Classes )======================================== // #
 
 
@@ -101,38 +120,26 @@ class Dropdown(StatefulSelect):
         **kwargs,
     ):
         # Process options if they're dictionaries
-        processed_options = []
-        for opt in options:
-            if isinstance(opt, dict):
-                processed_options.append(
-                    SelectOption(
-                        label=opt.get("label", "Option"),
-                        value=opt.get("value", opt.get("label", "Option")),
-                        description=opt.get("description"),
-                        emoji=opt.get("emoji"),
-                        default=opt.get("default", False),
-                    )
-                )
-            else:
-                processed_options.append(opt)
+        processed_options = [
+            _option_from_dict(opt) if isinstance(opt, dict) else opt for opt in options
+        ]
 
         super().__init__(
             options=processed_options, placeholder=placeholder, callback=callback, **kwargs
         )
 
 
-class RoleSelect(discord.ui.RoleSelect, StatefulComponent):
-    """A role select menu with state management.
+class _EntitySelectMixin:
+    """Shared constructor and default-value plumbing for the entity selects.
 
-    Accepts a permissive ``default_values=`` kwarg: pass raw ``int``
-    role IDs, ``discord.Role`` objects, or pre-built
-    :class:`discord.SelectDefaultValue` instances. CascadeUI coerces
-    each entry to the discord.py shape, wrapping bare IDs/Snowflakes
-    with ``type="role"`` automatically. Use :meth:`set_default_values`
-    to update defaults after construction.
+    RoleSelect, ChannelSelect, UserSelect and MentionableSelect differ only
+    in their discord.py base and in how raw defaults are typed, so the
+    ``__init__`` body lives here once. Subclasses pick the typing through
+    :meth:`_wrap_defaults`; the default implementation stamps every entry
+    with the class's ``_DEFAULT_VALUE_TYPE``.
     """
 
-    _DEFAULT_VALUE_TYPE = "role"
+    _DEFAULT_VALUE_TYPE: str
 
     def __init__(
         self,
@@ -142,15 +149,39 @@ class RoleSelect(discord.ui.RoleSelect, StatefulComponent):
         **kwargs,
     ):
         if default_values is not None:
-            kwargs["default_values"] = _wrap_default_values(
-                default_values, self._DEFAULT_VALUE_TYPE
-            )
+            kwargs["default_values"] = self._wrap_defaults(default_values)
         super().__init__(placeholder=placeholder, **kwargs)
 
         self.original_callback = callback
         if callback:
             self.callback = self.create_stateful_callback(self, callback)
 
+    @classmethod
+    def _wrap_defaults(cls, values: Optional[Iterable[Any]]) -> List[discord.SelectDefaultValue]:
+        return _wrap_default_values(values, cls._DEFAULT_VALUE_TYPE)
+
+    def set_default_values(self, values: Optional[Sequence[Any]]) -> None:
+        """Replace the default-value list with *values*.
+
+        Accepts the same permissive input shape as the constructor.
+        ``None`` or an empty sequence clears the defaults.
+        """
+        self.default_values = self._wrap_defaults(values)
+
+
+class RoleSelect(_EntitySelectMixin, discord.ui.RoleSelect, StatefulComponent):
+    """A role select menu with state management.
+
+    Accepts a permissive ``default_values=`` kwarg: pass raw ``int``
+    role IDs, ``discord.Role`` objects, or pre-built
+    :class:`discord.SelectDefaultValue` instances. CascadeUI coerces
+    each entry to the discord.py shape, wrapping bare IDs/Snowflakes
+    with ``type="role"`` automatically. Use :meth:`set_default_values`
+    to update defaults after construction.
+    """
+
+    _DEFAULT_VALUE_TYPE = "role"
+
     def set_default_values(self, values: Optional[Sequence[Any]]) -> None:
         """Replace the default-value list with *values*.
 
@@ -159,10 +190,10 @@ class RoleSelect(discord.ui.RoleSelect, StatefulComponent):
         ``discord.SelectDefaultValue`` instances. ``None`` or an empty
         sequence clears the defaults.
         """
-        self.default_values = _wrap_default_values(values, self._DEFAULT_VALUE_TYPE)
+        super().set_default_values(values)
 
 
-class ChannelSelect(discord.ui.ChannelSelect, StatefulComponent):
+class ChannelSelect(_EntitySelectMixin, discord.ui.ChannelSelect, StatefulComponent):
     """A channel select menu with state management.
 
     Accepts a permissive ``default_values=`` kwarg: pass raw ``int``
@@ -175,32 +206,8 @@ class ChannelSelect(discord.ui.ChannelSelect, StatefulComponent):
 
     _DEFAULT_VALUE_TYPE = "channel"
 
-    def __init__(
-        self,
-        placeholder: Optional[str] = None,
-        callback: Optional[Callable] = None,
-        default_values: Optional[Sequence[Any]] = None,
-        **kwargs,
-    ):
-        if default_values is not None:
-            kwargs["default_values"] = _wrap_default_values(
-                default_values, self._DEFAULT_VALUE_TYPE
-            )
-        super().__init__(placeholder=placeholder, **kwargs)
-
-        self.original_callback = callback
-        if callback:
-            self.callback = self.create_stateful_callback(self, callback)
-
-    def set_default_values(self, values: Optional[Sequence[Any]]) -> None:
-        """Replace the default-value list with *values*.
-
-        Accepts the same permissive input shape as the constructor.
-        """
-        self.default_values = _wrap_default_values(values, self._DEFAULT_VALUE_TYPE)
-
 
-class UserSelect(discord.ui.UserSelect, StatefulComponent):
+class UserSelect(_EntitySelectMixin, discord.ui.UserSelect, StatefulComponent):
     """A user select menu with state management.
 
     Accepts a permissive ``default_values=`` kwarg: pass raw ``int``
@@ -213,32 +220,8 @@ class UserSelect(discord.ui.UserSelect, StatefulComponent):
 
     _DEFAULT_VALUE_TYPE = "user"
 
-    def __init__(
-        self,
-        placeholder: Optional[str] = None,
-        callback: Optional[Callable] = None,
-        default_values: Optional[Sequence[Any]] = None,
-        **kwargs,
-    ):
-        if default_values is not None:
-            kwargs["default_values"] = _wrap_default_values(
-                default_values, self._DEFAULT_VALUE_TYPE
-            )
-        super().__init__(placeholder=placeholder, **kwargs)
 
-        self.original_callback = callback
-        if callback:
-            self.callback = self.create_stateful_callback(self, callback)
-
-    def set_default_values(self, values: Optional[Sequence[Any]]) -> None:
-        """Replace the default-value list with *values*.
-
-        Accepts the same permissive input shape as the constructor.
-        """
-        self.default_values = _wrap_default_values(values, self._DEFAULT_VALUE_TYPE)
-
-
-class MentionableSelect(discord.ui.MentionableSelect, StatefulComponent):
+class MentionableSelect(_EntitySelectMixin, discord.ui.MentionableSelect, StatefulComponent):
     """A mentionable select menu with state management.
 
     Accepts both users and roles, so default values must carry their
@@ -254,20 +237,11 @@ class MentionableSelect(discord.ui.MentionableSelect, StatefulComponent):
     with ``type="user"`` or ``type="role"``.
     """
 
-    def __init__(
-        self,
-        placeholder: Optional[str] = None,
-        callback: Optional[Callable] = None,
-        default_values: Optional[Sequence[Any]] = None,
-        **kwargs,
-    ):
-        if default_values is not None:
-            kwargs["default_values"] = _wrap_mentionable_defaults(default_values)
-        super().__init__(placeholder=placeholder, **kwargs)
-
-        self.original_callback = callback
-        if callback:
-            self.callback = self.create_stateful_callback(self, callback)
+    @classmethod
+    def _wrap_defaults(cls, values: Optional[Iterable[Any]]) -> List[discord.SelectDefaultValue]:
+        # Users and roles share one select, so the type comes from each
+        # object's class rather than a fixed ``_DEFAULT_VALUE_TYPE``.
+        return _wrap_mentionable_defaults(values)
 
     def set_default_values(self, values: Optional[Sequence[Any]]) -> None:
         """Replace the default-value list with *values*.
@@ -277,4 +251,4 @@ class MentionableSelect(discord.ui.MentionableSelect, StatefulComponent):
         ``"user"``, ``Role`` -> ``"role"``); raw ``int`` IDs are
         rejected.
         """
-        self.default_values = _wrap_mentionable_defaults(values)
+        super().set_default_values(values)
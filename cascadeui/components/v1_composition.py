@@ -1,6 +1,7 @@
 # // ========================================( Modules )======================================== // #
 
 
+from types import MappingProxyType
 from typing import Any, Callable, Dict, List, Optional, Type, Union
 
 import discord
@@ -11,21 +12,57 @@ from .base import StatefulButton, StatefulComponent
 
 # Component registry for pre-built components
 _component_registry = {}
+_builtin_components_loaded = False
 
 
 # // ========================================( Scripts )======================================== // #
 
 
+def _ensure_builtin_components() -> None:
+    """Import the V1 patterns, which register themselves, on first registry use.
+
+    ``cascadeui.components`` resolves its exports lazily, so the patterns
+    module is no longer guaranteed to be loaded before a lookup. Loading it
+    here also keeps user registrations landing after (and overriding) the
+    built-ins.
+    """
+    global _builtin_components_loaded
+    if not _builtin_components_loaded:
+        _builtin_components_loaded = True
+        from .patterns import v1  # noqa: F401
+
+
 def register_component(name: str, component_class: Type) -> None:
     """Register a component in the global registry."""
+    _ensure_builtin_components()
+    if isinstance(_component_registry, MappingProxyType):
+        raise RuntimeError(
+            f"Cannot register component {name!r}: the component registry is frozen.\n"
+            f"  Fix: Register every component before calling freeze_registry()."
+        )
     _component_registry[name] = component_class
 
 
 def get_component(name: str) -> Optional[Type]:
     """Get a component class from the registry."""
+    _ensure_builtin_components()
     return _component_registry.get(name)
 
 
+def freeze_registry() -> None:
+    """Freeze the component registry into a read-only mapping.
+
+    Call once setup has registered everything. Lookups keep working through
+    :func:`get_component`; later :func:`register_component` calls raise
+    ``RuntimeError`` instead of silently changing what a name resolves to
+    while views are live.
+    """
+    global _component_registry
+    _ensure_builtin_components()
+    if not isinstance(_component_registry, MappingProxyType):
+        _component_registry = MappingProxyType(dict(_component_registry))
+
+
 class CompositeComponent:
     """Base class for composite components."""
 
@@ -38,15 +75,32 @@ class CompositeComponent:
         return self
 
     def create_discord_components(self) -> List:
-        """Create Discord UI components for all child components."""
+        """Create Discord UI components for all child components.
+
+        Nested composites are flattened with an explicit stack of child
+        iterators rather than recursion, so a deep tree fills one output
+        list instead of allocating and extending one list per level.
+        """
         result = []
-        for component in self.components:
-            if hasattr(component, "create_discord_components"):
-                # Handle composite components
-                result.extend(component.create_discord_components())
+        stack = [iter(self.components)]
+        while stack:
+            for component in stack[-1]:
+                build = getattr(component, "create_discord_components", None)
+                if build is None:
+                    # Direct Discord component
+                    result.append(component)
+                elif (
+                    type(component).create_discord_components
+                    is CompositeComponent.create_discord_components
+                ):
+                    # Plain nested composite -- descend without recursing
+                    stack.append(iter(component.components))
+                    break
+                else:
+                    # Composite with its own build logic
+                    result.extend(build())
             else:
-                # Handle direct Discord components
-                result.append(component)
+                stack.pop()
         return result
 
     def add_to_view(self, view, row=None) -> Any:
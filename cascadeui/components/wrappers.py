@@ -7,6 +7,7 @@ from typing import Any, Callable, Dict, Optional
 import discord
 from discord import ButtonStyle, Interaction
 
+from ..views.base import _StatefulMixin
 from .types import EmojiInput
 
 # // ========================================( Constants )======================================== // #
@@ -15,59 +16,56 @@ from .types import EmojiInput
 _VALID_COOLDOWN_SCOPES = frozenset({"user", "guild", "user_guild", "global"})
 
 
-# // ========================================( Functions )======================================== // #
+# // ========================================( Classes )======================================== // #
 
 
-def with_loading_state(
-    component: Any,
-    loading_label: str = "Loading...",
-    loading_emoji: EmojiInput = None,
-) -> Any:
-    """Add loading state to a component.
+class _LoadingCallback:
+    """Callback installed by :func:`with_loading_state`.
 
-    While the original callback runs, the component is disabled and its label
-    is replaced with ``loading_label``. Loading UX requires consuming the
-    interaction response slot to ship the disabled state immediately, which
-    is mutually exclusive with the acting-view fast path in ``refresh()`` --
-    opting into loading feedback opts out of the one-HTTP-call refresh for
-    this click. The subsequent state-driven refresh falls through to the
-    channel endpoint, which is the correct trade for callbacks expected to
-    take long enough to warrant a spinner.
-
-    For ``_StatefulMixin`` views, the pre-edit and restore route through
-    ``view.refresh()`` so rate-limit backoff, render-hash skipping, and
-    cooldown stamping all participate in the wrapper's edits.
-
-    The original callback receives an interaction whose response may already
-    be consumed. Use ``self.respond(interaction, ...)`` for any replies --
-    it routes through ``interaction.response`` or ``interaction.followup``
-    automatically.
-
-    Args:
-        component: The component to wrap.
-        loading_label: Text shown on the button while loading.
-        loading_emoji: Optional emoji shown on the button while loading.
+    The wrappers install small slotted callables instead of per-component
+    closures: wrapper state lives in attributes rather than closure cells,
+    and every wrapped component shares one ``__call__`` code object.
     """
-    original_callback = component.callback
-    original_label = component.label if hasattr(component, "label") else None
-    original_emoji = component.emoji if hasattr(component, "emoji") else None
 
-    async def loading_callback(interaction: Interaction) -> None:
+    __slots__ = (
+        "component",
+        "original_callback",
+        "has_label",
+        "has_emoji",
+        "original_label",
+        "original_emoji",
+        "loading_label",
+        "loading_emoji",
+    )
+
+    def __init__(self, component: Any, loading_label: str, loading_emoji: EmojiInput) -> None:
+        self.component = component
+        self.original_callback = component.callback
+        # Probed once at wrap time; whether the component carries a label or
+        # emoji is fixed by its type, so clicks never repeat the hasattr.
+        self.has_label = has_label = hasattr(component, "label")
+        self.has_emoji = has_emoji = hasattr(component, "emoji")
+        self.original_label = component.label if has_label else None
+        self.original_emoji = component.emoji if has_emoji else None
+        self.loading_label = loading_label
+        self.loading_emoji = loading_emoji
+
+    async def __call__(self, interaction: Interaction) -> None:
+        component = self.component
         view = component.view
 
         component.disabled = True
-        if hasattr(component, "label"):
-            component.label = loading_label
-        if loading_emoji is not None and hasattr(component, "emoji"):
-            component.emoji = loading_emoji
+        if self.has_label:
+            component.label = self.loading_label
+        if self.loading_emoji is not None and self.has_emoji:
+            component.emoji = self.loading_emoji
 
         # Route pre-edit through view.refresh() for stateful views so the
         # library's throttle/digest/backoff path handles the edit. Falls
         # through to direct response.edit_message for plain discord.ui
         # views, and silently skips when the response slot is already
         # consumed (auto-defer fired, or the callback opened the slot).
-        from ..views.base import _StatefulMixin
-
+        responded_here = False
         if isinstance(view, _StatefulMixin) and view._message is not None:
             try:
                 await view.refresh()
@@ -76,11 +74,12 @@ def with_loading_state(
         elif not interaction.response.is_done():
             try:
                 await interaction.response.edit_message(view=view)
+                responded_here = True
             except discord.InteractionResponded:
                 pass
 
         try:
-            await original_callback(interaction)
+            await self.original_callback(interaction)
         except discord.InteractionResponded:
             raise RuntimeError(
                 f"The callback wrapped by with_loading_state tried to use "
@@ -89,75 +88,90 @@ def with_loading_state(
             )
         finally:
             component.disabled = False
-            if hasattr(component, "label") and original_label is not None:
-                component.label = original_label
-            if hasattr(component, "emoji"):
-                component.emoji = original_emoji
+            if self.has_label and self.original_label is not None:
+                component.label = self.original_label
+            if self.has_emoji:
+                component.emoji = self.original_emoji
 
             # Restore edit goes through refresh() for stateful views so
             # the restore participates in cooldown throttling + 429 backoff
-            # rather than racing with state-driven refreshes; plain views
-            # fall back to the interaction-message edit path.
-            try:
-                if hasattr(view, "is_finished") and view.is_finished():
-                    pass
-                elif isinstance(view, _StatefulMixin) and view._message is not None:
+            # rather than racing with state-driven refreshes. Plain views
+            # whose loading state went out through this interaction's
+            # response restore through the same interaction webhook, which
+            # sits outside the channel's message-edit rate limit; otherwise
+            # they fall back to the interaction-message edit path.
+            if hasattr(view, "is_finished") and view.is_finished():
+                pass
+            elif isinstance(view, _StatefulMixin) and view._message is not None:
+                try:
                     await view.refresh()
-                elif interaction.message:
+                except Exception:
+                    pass
+            elif responded_here:
+                try:
+                    await interaction.edit_original_response(view=view)
+                except discord.HTTPException:
+                    pass
+            elif interaction.message:
+                try:
                     await interaction.message.edit(view=view)
-            except Exception:
-                pass
-
-    component.callback = loading_callback
-    return component
-
-
-def with_confirmation(
-    component: Any,
-    title: str = "Confirm Action",
-    message: str = "Are you sure?",
-    color: discord.Color = discord.Color.yellow(),
-    confirm_label: str = "Yes",
-    cancel_label: str = "No",
-    confirm_style: ButtonStyle = ButtonStyle.success,
-    cancel_style: ButtonStyle = ButtonStyle.danger,
-    confirmed_message: str = "Confirmed.",
-    cancelled_message: str = "Cancelled.",
-    on_cancel: Optional[Callable] = None,
-    timeout: float = 60.0,
-) -> Any:
-    """Add a confirmation step to a component.
-
-    When the component is clicked, an ephemeral confirmation prompt is shown.
-    If confirmed, the prompt is edited to ``confirmed_message`` and the
-    original callback is called. If cancelled, the prompt is edited to
-    ``cancelled_message`` and the optional ``on_cancel`` callback is called.
-    Both terminal paths call ``stop()`` on the inner confirmation View so
-    the timeout task is cancelled immediately instead of lingering until
-    the natural expiry.
-
-    The original callback (and ``on_cancel``) receive the confirmation
-    button's interaction with the response already consumed.
-    Use ``self.respond(interaction, ...)`` for any replies.
+                except discord.HTTPException:
+                    pass
 
-    Args:
-        component: The component to wrap.
-        title: Embed title for the confirmation prompt.
-        message: Embed description for the confirmation prompt.
-        color: Embed color for the confirmation prompt.
-        confirm_label: Label for the confirm button.
-        cancel_label: Label for the cancel button.
-        confirm_style: Style for the confirm button.
-        cancel_style: Style for the cancel button.
-        confirmed_message: Text shown after confirming.
-        cancelled_message: Text shown after cancelling.
-        on_cancel: Optional async callback invoked on cancel.
-        timeout: Seconds before the confirmation prompt expires.
-    """
-    original_callback = component.callback
 
-    async def confirmation_callback(interaction: Interaction) -> None:
-        confirmation_view = discord.ui.View(timeout=timeout)
+class _ConfirmationCallback:
+    """Callback installed by :func:`with_confirmation`."""
+
+    __slots__ = (
+        "component",
+        "original_callback",
+        "embed",
+        "confirm_label",
+        "cancel_label",
+        "confirm_style",
+        "cancel_style",
+        "confirmed_message",
+        "cancelled_message",
+        "on_cancel",
+        "timeout",
+    )
+
+    def __init__(
+        self,
+        component: Any,
+        *,
+        title: str,
+        message: str,
+        color: discord.Color,
+        confirm_label: str,
+        cancel_label: str,
+        confirm_style: ButtonStyle,
+        cancel_style: ButtonStyle,
+        confirmed_message: str,
+        cancelled_message: str,
+        on_cancel: Optional[Callable],
+        timeout: float,
+    ) -> None:
+        self.component = component
+        self.original_callback = component.callback
+        # The prompt text is fixed per wrapper, so the embed is built once and
+        # shared by every prompt; discord.py serializes it on each send.
+        self.embed = discord.Embed(title=title, description=message, color=color)
+        self.confirm_label = confirm_label
+        self.cancel_label = cancel_label
+        self.confirm_style = confirm_style
+        self.cancel_style = cancel_style
+        self.confirmed_message = confirmed_message
+        self.cancelled_message = cancelled_message
+        self.on_cancel = on_cancel
+        self.timeout = timeout
+
+    async def __call__(self, interaction: Interaction) -> None:
+        confirmation_view = discord.ui.View(timeout=self.timeout)
+        original_callback = self.original_callback
+        on_cancel = self.on_cancel
+        confirmed_message = self.confirmed_message
+        cancelled_message = self.cancelled_message
 
         async def _on_confirm(confirm_interaction: Interaction) -> None:
             try:
@@ -191,23 +205,21 @@ def with_confirmation(
             finally:
                 confirmation_view.stop()
 
-        confirm_button = discord.ui.Button(label=confirm_label, style=confirm_style)
+        confirm_button = discord.ui.Button(label=self.confirm_label, style=self.confirm_style)
         confirm_button.callback = _on_confirm
 
-        cancel_button = discord.ui.Button(label=cancel_label, style=cancel_style)
+        cancel_button = discord.ui.Button(label=self.cancel_label, style=self.cancel_style)
         cancel_button.callback = _on_cancel
 
         confirmation_view.add_item(confirm_button)
         confirmation_view.add_item(cancel_button)
 
-        embed = discord.Embed(title=title, description=message, color=color)
+        embed = self.embed
 
         # Route the prompt through view.respond() when the parent is a
         # CascadeUI view so the library's is_done()-absorbing helper does
         # the branching; plain discord.ui views retain the inline branch.
-        from ..views.base import _StatefulMixin
-
-        view = component.view
+        view = self.component.view
         if isinstance(view, _StatefulMixin):
             await view.respond(interaction, embed=embed, view=confirmation_view, ephemeral=True)
         elif not interaction.response.is_done():
@@ -217,7 +229,154 @@ def with_confirmation(
         else:
             await interaction.followup.send(embed=embed, view=confirmation_view, ephemeral=True)
 
-    component.callback = confirmation_callback
+
+class _CooldownCallback:
+    """Callback installed by :func:`with_cooldown`."""
+
+    __slots__ = ("component", "original_callback", "seconds", "message", "scope", "cooldowns")
+
+    _DEFAULT_MESSAGE = "This action is on cooldown. Try again in {remaining} seconds."
+
+    def __init__(self, component: Any, seconds: int, message: Optional[str], scope: str) -> None:
+        self.component = component
+        self.original_callback = component.callback
+        self.seconds = seconds
+        self.message = message
+        self.scope = scope
+        # Monotonic clock avoids DST / NTP-skew unlocking cooldowns early.
+        self.cooldowns: Dict[Any, float] = {}
+
+    def _get_key(self, interaction: Interaction) -> Any:
+        scope = self.scope
+        if scope == "guild":
+            return interaction.guild_id or interaction.user.id
+        elif scope == "user_guild":
+            return (interaction.user.id, interaction.guild_id)
+        elif scope == "global":
+            return "__global__"
+        return interaction.user.id
+
+    async def __call__(self, interaction: Interaction) -> None:
+        cooldowns = self.cooldowns
+        key = self._get_key(interaction)
+        now = time.monotonic()
+
+        expired = [k for k, v in cooldowns.items() if now >= v]
+        for k in expired:
+            del cooldowns[k]
+
+        deadline = cooldowns.get(key)
+
+        if deadline is not None and now < deadline:
+            remaining = deadline - now
+            text = (self.message or self._DEFAULT_MESSAGE).format(remaining=f"{remaining:.1f}")
+
+            view = self.component.view
+            if isinstance(view, _StatefulMixin):
+                await view.respond(interaction, text, ephemeral=True)
+            elif not interaction.response.is_done():
+                await interaction.response.send_message(text, ephemeral=True)
+            else:
+                await interaction.followup.send(text, ephemeral=True)
+            return
+
+        cooldowns[key] = now + self.seconds
+        await self.original_callback(interaction)
+
+
+# // ========================================( Functions )======================================== // #
+
+
+def with_loading_state(
+    component: Any,
+    loading_label: str = "Loading...",
+    loading_emoji: EmojiInput = None,
+) -> Any:
+    """Add loading state to a component.
+
+    While the original callback runs, the component is disabled and its label
+    is replaced with ``loading_label``. Loading UX requires consuming the
+    interaction response slot to ship the disabled state immediately, which
+    is mutually exclusive with the acting-view fast path in ``refresh()`` --
+    opting into loading feedback opts out of the one-HTTP-call refresh for
+    this click. The subsequent state-driven refresh falls through to the
+    channel endpoint, which is the correct trade for callbacks expected to
+    take long enough to warrant a spinner.
+
+    For ``_StatefulMixin`` views, the pre-edit and restore route through
+    ``view.refresh()`` so rate-limit backoff, render-hash skipping, and
+    cooldown stamping all participate in the wrapper's edits.
+
+    The original callback receives an interaction whose response may already
+    be consumed. Use ``self.respond(interaction, ...)`` for any replies --
+    it routes through ``interaction.response`` or ``interaction.followup``
+    automatically.
+
+    Args:
+        component: The component to wrap.
+        loading_label: Text shown on the button while loading.
+        loading_emoji: Optional emoji shown on the button while loading.
+    """
+    component.callback = _LoadingCallback(component, loading_label, loading_emoji)
+    return component
+
+
+def with_confirmation(
+    component: Any,
+    title: str = "Confirm Action",
+    message: str = "Are you sure?",
+    color: discord.Color = discord.Color.yellow(),
+    confirm_label: str = "Yes",
+    cancel_label: str = "No",
+    confirm_style: ButtonStyle = ButtonStyle.success,
+    cancel_style: ButtonStyle = ButtonStyle.danger,
+    confirmed_message: str = "Confirmed.",
+    cancelled_message: str = "Cancelled.",
+    on_cancel: Optional[Callable] = None,
+    timeout: float = 60.0,
+) -> Any:
+    """Add a confirmation step to a component.
+
+    When the component is clicked, an ephemeral confirmation prompt is shown.
+    If confirmed, the prompt is edited to ``confirmed_message`` and the
+    original callback is called. If cancelled, the prompt is edited to
+    ``cancelled_message`` and the optional ``on_cancel`` callback is called.
+    Both terminal paths call ``stop()`` on the inner confirmation View so
+    the timeout task is cancelled immediately instead of lingering until
+    the natural expiry.
+
+    The original callback (and ``on_cancel``) receive the confirmation
+    button's interaction with the response already consumed.
+    Use ``self.respond(interaction, ...)`` for any replies.
+
+    Args:
+        component: The component to wrap.
+        title: Embed title for the confirmation prompt.
+        message: Embed description for the confirmation prompt.
+        color: Embed color for the confirmation prompt.
+        confirm_label: Label for the confirm button.
+        cancel_label: Label for the cancel button.
+        confirm_style: Style for the confirm button.
+        cancel_style: Style for the cancel button.
+        confirmed_message: Text shown after confirming.
+        cancelled_message: Text shown after cancelling.
+        on_cancel: Optional async callback invoked on cancel.
+        timeout: Seconds before the confirmation prompt expires.
+    """
+    component.callback = _ConfirmationCallback(
+        component,
+        title=title,
+        message=message,
+        color=color,
+        confirm_label=confirm_label,
+        cancel_label=cancel_label,
+        confirm_style=confirm_style,
+        cancel_style=cancel_style,
+        confirmed_message=confirmed_message,
+        cancelled_message=cancelled_message,
+        on_cancel=on_cancel,
+        timeout=timeout,
+    )
     return component
 
 
@@ -253,47 +412,5 @@ def with_cooldown(
             f"Valid scopes: {sorted(_VALID_COOLDOWN_SCOPES)}"
         )
 
-    original_callback = component.callback
-    # Monotonic clock avoids DST / NTP-skew unlocking cooldowns early.
-    cooldowns: Dict[Any, float] = {}
-    default_message = "This action is on cooldown. Try again in {remaining} seconds."
-
-    def _get_key(interaction: Interaction) -> Any:
-        if scope == "guild":
-            return interaction.guild_id or interaction.user.id
-        elif scope == "user_guild":
-            return (interaction.user.id, interaction.guild_id)
-        elif scope == "global":
-            return "__global__"
-        return interaction.user.id
-
-    async def cooldown_callback(interaction: Interaction) -> None:
-        key = _get_key(interaction)
-        now = time.monotonic()
-
-        expired = [k for k, v in cooldowns.items() if now >= v]
-        for k in expired:
-            del cooldowns[k]
-
-        deadline = cooldowns.get(key)
-
-        if deadline is not None and now < deadline:
-            remaining = deadline - now
-            text = (message or default_message).format(remaining=f"{remaining:.1f}")
-
-            from ..views.base import _StatefulMixin
-
-            view = component.view
-            if isinstance(view, _StatefulMixin):
-                await view.respond(interaction, text, ephemeral=True)
-            elif not interaction.response.is_done():
-                await interaction.response.send_message(text, ephemeral=True)
-            else:
-                await interaction.followup.send(text, ephemeral=True)
-            return
-
-        cooldowns[key] = now + seconds
-        await original_callback(interaction)
-
-    component.callback = cooldown_callback
+    component.callback = _CooldownCallback(component, seconds, message, scope)
     return component
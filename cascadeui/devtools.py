@@ -1774,7 +1774,7 @@ class DevToolsCog(commands.Cog, name="cascadeui_devtools"):
             return await ctx.send("No actions in history.", ephemeral=True)
 
         limit = max(1, min(limit, store.history_limit))
-        recent = store.history[-limit:]
+        recent = list(store.history)[-limit:]
         lines = [f"**Last {len(recent)} action(s)** (of {len(store.history)})"]
         for action in recent:
             action_type = action.get("type", "?")
@@ -1,12 +1,17 @@
 # // ========================================( Modules )======================================== // #
 
 
-from .actions import ActionCreators
-from .middleware import LoggingMiddleware, PersistenceMiddleware, UndoMiddleware
-from .singleton import get_store
-from .slots import access_slot, read_slot, slot_property
-from .store import StateStore
-from .types import Action, StateData
+from typing import TYPE_CHECKING
+
+from ..utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .actions import ActionCreators
+    from .middleware import LoggingMiddleware, PersistenceMiddleware, UndoMiddleware
+    from .singleton import get_store
+    from .slots import access_slot, read_slot, slot_property
+    from .store import StateStore
+    from .types import Action, StateData
 
 # // ========================================( Script )======================================== // #
 
@@ -24,3 +29,18 @@ __all__ = [
     "read_slot",
     "slot_property",
 ]
+
+# Resolved on first access. Importing a submodule such as ``.store`` runs
+# this init first, so keeping it lazy stops every store import from
+# dragging in the persistence middleware and its database backends.
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".actions": ("ActionCreators",),
+        ".middleware": ("LoggingMiddleware", "PersistenceMiddleware", "UndoMiddleware"),
+        ".singleton": ("get_store",),
+        ".slots": ("access_slot", "read_slot", "slot_property"),
+        ".store": ("StateStore",),
+        ".types": ("Action", "StateData"),
+    },
+)
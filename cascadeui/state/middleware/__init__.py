@@ -1,9 +1,14 @@
 # // ========================================( Modules )======================================== // #
 
 
-from .logging import LoggingMiddleware
-from .persistence import PersistenceMiddleware
-from .undo import UndoMiddleware
+from typing import TYPE_CHECKING
+
+from ...utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .logging import LoggingMiddleware
+    from .persistence import PersistenceMiddleware
+    from .undo import UndoMiddleware
 
 # // ========================================( Script )======================================== // #
 
@@ -13,3 +18,14 @@ __all__ = [
     "PersistenceMiddleware",
     "UndoMiddleware",
 ]
+
+# Resolved on first access; the reducers import ``.undo`` directly and should
+# not pay for the persistence middleware's backend imports along the way.
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".logging": ("LoggingMiddleware",),
+        ".persistence": ("PersistenceMiddleware",),
+        ".undo": ("UndoMiddleware",),
+    },
+)
@@ -121,6 +121,7 @@ class _NamespaceState:
     first_dirty_at: Optional[float] = None
     last_action_at: float = 0.0
     task: Optional[asyncio.Task] = None
+    retry_task: Optional[asyncio.Task] = None
     write_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
     retry_count: int = 0
 
@@ -586,7 +587,7 @@ class PersistenceMiddleware:
     # // ========================================( Scheduler )======================================== // #
 
     def _schedule(self, ns: _NamespaceState) -> None:
-        """Schedule or reschedule a debounced flush for ``ns``."""
+        """Schedule a flush for ``ns`` or extend its pending debounce window."""
         now = time.monotonic()
         if ns.first_dirty_at is None:
             ns.first_dirty_at = now
@@ -599,21 +600,17 @@ class PersistenceMiddleware:
             self._spawn(self._run_flush(ns, wait=0.0))
             return
 
-        # Debounced flush: cancel and reschedule. The dirty-row buffer
-        # carries state across cancels, so accumulated writes flush
-        # together when the timer finally fires.
+        # Debounced flush: one timer per window. A timer that is already
+        # sleeping re-reads ``last_action_at`` when it wakes and sleeps
+        # again if the window moved, so a burst of dispatches keeps a
+        # single task alive instead of cancelling and respawning one per
+        # action. The dirty-row buffer accumulates in the meantime.
+        # "Armed" is read off the task itself, so a timer cancelled by
+        # ``flush_all`` (even before its first step) never blocks the next
+        # window.
         if ns.task is not None and not ns.task.done():
-            ns.task.cancel()
-
-        # Window selection: smaller of (idle interval) and
-        # (max_age ceiling minus already-elapsed age). The ceiling keeps
-        # steady traffic from starving writes indefinitely.
-        age = now - ns.first_dirty_at
-        wait_idle = ns.interval
-        wait_ceiling = max(0.0, ns.max_age - age)
-        wait = min(wait_idle, wait_ceiling)
-
-        ns.task = self._spawn(self._run_flush(ns, wait=wait))
+            return
+        ns.task = self._spawn(self._run_debounced(ns))
 
     def _spawn(self, coro: "asyncio.coroutines.Coroutine") -> asyncio.Task:
         """Create an asyncio.Task directly and track it on ``self._tasks``.
@@ -627,6 +624,29 @@ class PersistenceMiddleware:
         task.add_done_callback(self._tasks.discard)
         return task
 
+    async def _run_debounced(self, ns: _NamespaceState) -> None:
+        """Sleep until the debounce window closes, then flush.
+
+        The window closes at the earlier of the idle deadline
+        (``last_action_at + interval``) and the max-age ceiling
+        (``first_dirty_at + max_age``). The ceiling keeps steady traffic
+        from starving writes indefinitely. Cancellation during sleep is a
+        no-op.
+        """
+        try:
+            while ns.first_dirty_at is not None:
+                deadline = min(ns.last_action_at + ns.interval, ns.first_dirty_at + ns.max_age)
+                wait = deadline - time.monotonic()
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            return
+
+        self._release_timer(ns)
+        async with ns.write_lock:
+            await self._flush(ns)
+
     async def _run_flush(self, ns: _NamespaceState, wait: float) -> None:
         """Sleep then flush. Cancellation during sleep is a no-op."""
         try:
@@ -638,6 +658,17 @@ class PersistenceMiddleware:
         async with ns.write_lock:
             await self._flush(ns)
 
+    @staticmethod
+    def _release_timer(ns: _NamespaceState) -> None:
+        """Drop ``ns.task`` once the calling task stops sleeping.
+
+        Runs before the flush takes the write lock, so dispatches that land
+        mid-flush schedule a fresh timer for whatever they dirty instead of
+        waiting on a task that already snapshotted the buffer.
+        """
+        if ns.task is asyncio.current_task():
+            ns.task = None
+
     async def _flush(self, ns: _NamespaceState) -> None:
         """Drain ``ns.dirty_rows`` and ``ns.deleted_keys`` to the backend."""
         if ns.backend is None:
@@ -699,7 +730,9 @@ class PersistenceMiddleware:
                 self._BACKOFF_CAP,
                 self._BACKOFF_BASE * (2 ** (ns.retry_count - 1)),
             )
-            ns.task = self._spawn(self._run_flush(ns, wait=backoff))
+            # Tracked apart from ``ns.task`` so a pending retry never reads
+            # as an armed debounce timer in ``_schedule``.
+            ns.retry_task = self._spawn(self._run_flush(ns, wait=backoff))
             return
 
         ns.retry_count = 0
@@ -817,7 +850,7 @@ class PersistenceMiddleware:
     # // ========================================( Shutdown )======================================== // #
 
     async def flush_all(self) -> None:
-        """Cancel pending tasks and flush every namespace synchronously.
+        """Cancel pending tasks and flush every namespace before returning.
 
         Called by :meth:`~cascadeui.persistence.manager.PersistenceManager.close`
         during bot shutdown. Each namespace flushes under its write
@@ -840,12 +873,23 @@ class PersistenceMiddleware:
         # runs, so a shutdown path that fires before startup completes
         # (failed boot, test teardown before install) must not crash
         # on ``None.write_lock``.
-        for ns in (self._ns_registry, self._ns_application):
-            if ns is None:
-                continue
+        #
+        # The namespaces write to separate tables under separate locks, so
+        # they drain concurrently; shutdown waits on the slower of the two
+        # rather than their sum. Every drain is awaited to completion even
+        # if another raises (hooks and table lookup sit outside ``_flush``'s
+        # error handling), so ``close()`` never shuts the backend while a
+        # sibling namespace is still writing.
+        async def _drain(ns: _NamespaceState) -> None:
             async with ns.write_lock:
                 await self._flush(ns)
 
+        namespaces = [ns for ns in (self._ns_registry, self._ns_application) if ns is not None]
+        results = await asyncio.gather(*(_drain(ns) for ns in namespaces), return_exceptions=True)
+        for ns, result in zip(namespaces, results):
+            if isinstance(result, Exception):
+                logger.error(f"Persistence drain failed for {ns.name!r}: {result}")
+
     async def close(self) -> None:
         """Stop accepting new writes and drain outstanding flushes."""
         self._closed = True
@@ -4,6 +4,8 @@ import copy
 from typing import Any, Dict
 
 from .middleware.undo import _MISSING
+from .slots import read_slot
+from .store import StateStore
 from .types import Action, StateData
 
 # // ========================================( Constants )======================================== // #
@@ -131,8 +133,12 @@ async def reduce_view_destroyed(action: Action, state: StateData) -> StateData:
     view_data = views[view_id]
     session_id = view_data.get("session_id")
 
-    new_state = {**state}
-    new_state["views"] = {k: v for k, v in views.items() if k != view_id}
+    # Copy-then-delete rather than a filtering comprehension: dict.copy()
+    # runs in C and keeps insertion order, so removal costs one bulk copy
+    # instead of a Python-level comparison per surviving entry.
+    new_views = views.copy()
+    del new_views[view_id]
+    new_state = {**state, "views": new_views}
 
     # Remove component interaction entries owned by this view
     components = state.get("components")
@@ -146,7 +152,8 @@ async def reduce_view_destroyed(action: Action, state: StateData) -> StateData:
     # Remove modal submission entries owned by this view
     modals = state.get("modals")
     if modals and view_id in modals:
-        new_modals = {k: v for k, v in modals.items() if k != view_id}
+        new_modals = modals.copy()
+        del new_modals[view_id]
         if new_modals:
             new_state["modals"] = new_modals
         else:
@@ -162,7 +169,9 @@ async def reduce_view_destroyed(action: Action, state: StateData) -> StateData:
                 new_session = {**session, "members": new_members}
                 new_state["sessions"] = {**sessions, session_id: new_session}
             else:
-                new_state["sessions"] = {k: v for k, v in sessions.items() if k != session_id}
+                new_sessions = sessions.copy()
+                del new_sessions[session_id]
+                new_state["sessions"] = new_sessions
 
     return new_state
 
@@ -350,10 +359,9 @@ async def reduce_persistent_view_unregistered(action: Action, state: StateData)
     if persistence_key not in persistent_views:
         return state
 
-    return {
-        **state,
-        "persistent_views": {k: v for k, v in persistent_views.items() if k != persistence_key},
-    }
+    new_persistent_views = persistent_views.copy()
+    del new_persistent_views[persistence_key]
+    return {**state, "persistent_views": new_persistent_views}
 
 
 async def reduce_inspector_purged_stale(action: Action, state: StateData) -> StateData:
@@ -432,9 +440,6 @@ async def reduce_scoped_update(action: Action, state: StateData) -> StateData:
     payload is malformed (missing scope / bad identifiers) rather than
     writing an unreachable key.
     """
-    from .slots import read_slot
-    from .store import StateStore  # lazy to avoid circular import
-
     payload = action["payload"]
     scope = payload.get("scope")
     if not scope:
@@ -3,12 +3,12 @@
 
 import asyncio
 import contextvars
-import copy
 import logging
 import time
+from collections import deque
 from datetime import datetime
 from types import MappingProxyType
-from typing import Any, Dict, Iterator, List, Mapping, Optional, Set, Tuple, Union
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple, Union
 
 from ..utils.errors import with_error_boundary
 from ..utils.tasks import get_task_manager
@@ -230,9 +230,9 @@ class StateStore:
         # Combined reducers
         self.reducers: Dict[str, ReducerFn] = {}
 
-        # Action history for debugging/time travel
-        self.history: List[Action] = []
-        self.history_limit = 100
+        # Action history for debugging/time travel. A bounded deque drops
+        # the oldest entry on append, so recording stays O(1) at the cap.
+        self._history: Deque[Action] = deque(maxlen=100)
 
         # Middleware pipeline (executed in order before reducers)
         self._middleware: List[MiddlewareFn] = []
@@ -309,6 +309,11 @@ class StateStore:
         self._notify_samples: _collections.deque = _collections.deque(maxlen=500)
 
         self._initialized = True
+
+        # Built-in reducers load once here rather than behind a per-dispatch
+        # check; the import inside is deferred only because reducers.py
+        # imports this module.
+        self._load_core_reducers()
         logger.debug("StateStore initialized")
 
     def enable_perf(self) -> None:
@@ -339,11 +344,11 @@ class StateStore:
         self._notify_samples.clear()
 
     def _load_core_reducers(self):
-        """Load the built-in reducers only when needed."""
+        """Load the built-in reducers. Called once from ``__init__``."""
         if self._core_reducers:
             return
 
-        # Import here to avoid circular imports
+        # Import here to avoid circular imports (reducers imports StateStore)
         from .reducers import (
             reduce_component_interaction,
             reduce_inspector_purged_stale,
@@ -383,8 +388,10 @@ class StateStore:
             "INSPECTOR_PURGED_STALE": reduce_inspector_purged_stale,
         }
 
-        # Update combined reducers
-        self.reducers = {**self._core_reducers, **self._custom_reducers}
+        # Fill in the combined map; custom reducers registered before the
+        # first dispatch keep their override.
+        for action_type, reducer in self._core_reducers.items():
+            self.reducers.setdefault(action_type, reducer)
         logger.debug("Core reducers loaded")
 
     def _register_reducer(self, action_type: str, reducer: ReducerFn) -> None:
@@ -402,8 +409,12 @@ class StateStore:
         """Remove a custom reducer. Internal plumbing."""
         if action_type in self._custom_reducers:
             del self._custom_reducers[action_type]
-            # Rebuild combined reducers
-            self.reducers = {**self._core_reducers, **self._custom_reducers}
+            # Fall back to the built-in reducer this one was overriding, if any
+            core = self._core_reducers.get(action_type)
+            if core is None:
+                del self.reducers[action_type]
+            else:
+                self.reducers[action_type] = core
 
     def _add_middleware(self, middleware: MiddlewareFn) -> None:
         """Add middleware to the dispatch pipeline.
@@ -495,6 +506,24 @@ class StateStore:
 
         return await chain(action, self.state)
 
+    @property
+    def history(self) -> Deque[Action]:
+        """Most recent dispatched actions, oldest first, capped at ``history_limit``."""
+        return self._history
+
+    @history.setter
+    def history(self, actions: Iterable[Action]) -> None:
+        self._history = deque(actions, maxlen=self._history.maxlen)
+
+    @property
+    def history_limit(self) -> int:
+        """Maximum number of actions retained in :attr:`history`."""
+        return self._history.maxlen
+
+    @history_limit.setter
+    def history_limit(self, limit: int) -> None:
+        self._history = deque(self._history, maxlen=limit)
+
     @property
     def _batching(self) -> bool:
         """Whether any batch context is currently active."""
@@ -1045,19 +1074,31 @@ class StateStore:
 
         store = self
 
+        # These fire for every deleted message the bot can see, and almost
+        # none belong to a view. Match against the live registry without
+        # copying it first; the hooks run only after the scan finishes, so
+        # their unregistration cannot mutate the dict mid-iteration.
         @bot.listen("on_raw_message_delete")
         async def _cascadeui_message_cleanup(payload):
-            for view in list(store._active_views.values()):
-                if view._message and view._message.id == payload.message_id:
-                    await view.on_message_delete()
+            message_id = payload.message_id
+            for view in store._active_views.values():
+                message = view._message
+                if message and message.id == message_id:
                     break
+            else:
+                return
+            await view.on_message_delete()
 
         @bot.listen("on_raw_bulk_message_delete")
         async def _cascadeui_bulk_message_cleanup(payload):
             deleted_ids = set(payload.message_ids)
-            for view in list(store._active_views.values()):
-                if view._message and view._message.id in deleted_ids:
-                    await view.on_message_delete()
+            matched = [
+                view
+                for view in store._active_views.values()
+                if view._message and view._message.id in deleted_ids
+            ]
+            for view in matched:
+                await view.on_message_delete()
 
         logger.debug("Message deletion cleanup listener installed")
 
@@ -1083,20 +1124,19 @@ class StateStore:
             "timestamp": datetime.now().isoformat(),
         }
 
-        logger.debug(f"Dispatching action {action_type} from source {source_id}")
+        # Resolved once per dispatch so the debug lines below cost a bool
+        # check, not an f-string build, when DEBUG is off (production).
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(f"Dispatching action {action_type} from source {source_id}")
 
         # Add to history for debugging
-        self.history.append(action)
-        if len(self.history) > self.history_limit:
-            self.history.pop(0)
-
-        # Make sure reducers are loaded
-        self._load_core_reducers()
+        self._history.append(action)
 
         # Find the appropriate reducer
         reducer = self.reducers.get(action_type)
 
-        if reducer:
+        if reducer and debug:
             logger.debug(f"Found reducer for action {action_type}")
 
         # Batched path: run reducer inline, queue the action, return early.
@@ -1130,7 +1170,8 @@ class StateStore:
                 t0 = time.perf_counter()
                 await self._run_middleware_chain(action, reducer)
                 t1 = time.perf_counter()
-                logger.debug(f"Notifying subscribers about {action_type}")
+                if debug:
+                    logger.debug(f"Notifying subscribers about {action_type}")
                 await self._notify_subscribers(action)
                 t2 = time.perf_counter()
                 await self._fire_hooks(action)
@@ -1163,7 +1204,8 @@ class StateStore:
             )
         else:
             await self._run_middleware_chain(action, reducer)
-            logger.debug(f"Notifying subscribers about {action_type}")
+            if debug:
+                logger.debug(f"Notifying subscribers about {action_type}")
             await self._notify_subscribers(action)
             await self._fire_hooks(action)
 
@@ -1184,9 +1226,14 @@ class StateStore:
         with ``source=None``) fall through to pure fire-and-forget until
         ``BatchContext`` threads a source id through.
         """
+        # Nothing to fan out to: skip the contextvar swap and loop setup.
+        if not self.subscribers:
+            return
+
         tasks = []
         acting_id = action.get("source")
         acting_coro = None
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         # ``asyncio.create_task`` copies the current context at task-creation
         # time, so cross-view subscriber tasks would otherwise inherit the
@@ -1233,7 +1280,8 @@ class StateStore:
                         and old_value is not self._SENTINEL
                         and new_value == old_value
                     ):
-                        logger.debug(f"Skipping subscriber {subscriber_id}: selector unchanged")
+                        if debug:
+                            logger.debug(f"Skipping subscriber {subscriber_id}: selector unchanged")
                         continue
                     self._last_selected[subscriber_id] = new_value
 
@@ -1241,7 +1289,10 @@ class StateStore:
                 if action.get("source") == subscriber_id and action.get("skip_self_notify", False):
                     continue
 
-                logger.debug(f"Notifying subscriber {subscriber_id} about action {action['type']}")
+                if debug:
+                    logger.debug(
+                        f"Notifying subscriber {subscriber_id} about action {action['type']}"
+                    )
                 # Bind the state snapshot at scheduling time so subscriber tasks
                 # see state-as-of-this-dispatch even if later dispatches have
                 # already reassigned ``self.state``. Safe under the shallow-spread
@@ -1261,9 +1312,10 @@ class StateStore:
                 )
                 tasks.append(task)
 
-            logger.debug(
-                f"Notifying {len(tasks)}/{len(self.subscribers)} subscribers about action: {action['type']}"
-            )
+            if debug:
+                logger.debug(
+                    f"Notifying {len(tasks)}/{len(self.subscribers)} subscribers about action: {action['type']}"
+                )
         finally:
             # Restore the live interaction before awaiting the acting coro
             # so ``refresh()`` in the acting subscriber sees the same value
@@ -1302,7 +1354,8 @@ class StateStore:
         if perf:
             t0 = time.perf_counter()
         try:
-            logger.debug(f"Executing notification callback for subscriber {subscriber_id}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Executing notification callback for subscriber {subscriber_id}")
             await callback(state, action)
         except Exception as e:
             logger.error(f"Error notifying subscriber {subscriber_id}: {e}", exc_info=True)
@@ -1354,8 +1407,7 @@ class StateStore:
         ``subscribe()`` should retain the ``subscriber_id`` and call
         this from its own cleanup path through the view lifecycle.
         """
-        if subscriber_id in self.subscribers:
-            del self.subscribers[subscriber_id]
+        self.subscribers.pop(subscriber_id, None)
         self._last_selected.pop(subscriber_id, None)
 
     @property
@@ -1,9 +1,14 @@
 # // ========================================( Modules )======================================== // #
 
 
-from .context import get_current_theme
-from .core import Theme, get_default_theme, get_theme, register_theme, set_default_theme
-from .themes import dark_theme, default_theme, light_theme
+from typing import TYPE_CHECKING
+
+from ..utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .context import get_current_theme
+    from .core import Theme, get_default_theme, get_theme, register_theme, set_default_theme
+    from .themes import dark_theme, default_theme, light_theme
 
 # // ========================================( Script )======================================== // #
 
@@ -19,3 +24,20 @@ __all__ = [
     "dark_theme",
     "light_theme",
 ]
+
+# Resolved on first access; the prebuilt themes are only constructed when
+# one of them (or the registry) is actually used.
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".context": ("get_current_theme",),
+        ".core": (
+            "Theme",
+            "get_default_theme",
+            "get_theme",
+            "register_theme",
+            "set_default_theme",
+        ),
+        ".themes": ("dark_theme", "default_theme", "light_theme"),
+    },
+)
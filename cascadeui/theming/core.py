@@ -66,21 +66,39 @@ class Theme:
 # Global theme registry
 _themes: Dict[str, Theme] = {}
 _default_theme: Optional[Theme] = None
+_builtin_themes_loaded = False
+
+
+def _ensure_builtin_themes() -> None:
+    """Register the built-in themes the first time the registry is touched.
+
+    The prebuilt themes live in ``themes.py`` and register themselves on
+    import. Deferring that import keeps ``import cascadeui.theming`` from
+    constructing them, while every registry entry point still sees them --
+    and user registrations still land after (and override) the built-ins.
+    """
+    global _builtin_themes_loaded
+    if not _builtin_themes_loaded:
+        _builtin_themes_loaded = True
+        from . import themes  # noqa: F401
 
 
 def register_theme(theme: Theme) -> None:
     """Register a theme in the global registry."""
+    _ensure_builtin_themes()
     _themes[theme.name] = theme
 
 
 def get_theme(name: str) -> Optional[Theme]:
     """Get a theme from the registry."""
+    _ensure_builtin_themes()
     return _themes.get(name)
 
 
 def set_default_theme(name: str) -> bool:
     """Set the default theme used when no per-view theme is specified."""
     global _default_theme
+    _ensure_builtin_themes()
     if name in _themes:
         _default_theme = _themes[name]
         return True
@@ -89,4 +107,5 @@ def set_default_theme(name: str) -> bool:
 
 def get_default_theme() -> Optional[Theme]:
     """Get the default theme."""
+    _ensure_builtin_themes()
     return _default_theme
@@ -1,12 +1,17 @@
 # // ========================================( Modules )======================================== // #
 
 
-from .coercion import coerce_snowflake_id, coerce_snowflake_id_set
-from .decorators import cascade_component, cascade_reducer
-from .errors import safe_execute, with_error_boundary, with_retry
-from .fetch import fetch_as_file
-from .strings import is_emoji, slugify
-from .tasks import get_task_manager
+from typing import TYPE_CHECKING
+
+from .lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .coercion import coerce_snowflake_id, coerce_snowflake_id_set
+    from .decorators import cascade_component, cascade_reducer
+    from .errors import safe_execute, with_error_boundary, with_retry
+    from .fetch import fetch_as_file
+    from .strings import is_emoji, slugify
+    from .tasks import get_task_manager
 
 # // ========================================( Script )======================================== // #
 
@@ -24,3 +29,15 @@ __all__ = [
     "coerce_snowflake_id_set",
     "fetch_as_file",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".coercion": ("coerce_snowflake_id", "coerce_snowflake_id_set"),
+        ".decorators": ("cascade_component", "cascade_reducer"),
+        ".errors": ("safe_execute", "with_error_boundary", "with_retry"),
+        ".fetch": ("fetch_as_file",),
+        ".strings": ("is_emoji", "slugify"),
+        ".tasks": ("get_task_manager",),
+    },
+)
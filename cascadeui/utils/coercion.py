@@ -32,6 +32,11 @@ def coerce_snowflake_id(value) -> Optional[int]:
     """
     if value is None:
         return None
+    # A plain ``int`` is by far the common input, and one exact-type check
+    # settles it; the subclass-aware checks below cover int subclasses
+    # (rejecting ``bool``) and Snowflake-shaped objects.
+    if type(value) is int:
+        return value
     if isinstance(value, int) and not isinstance(value, bool):
         return value
     snowflake_id = getattr(value, "id", None)
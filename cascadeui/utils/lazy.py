@@ -0,0 +1,52 @@
+# // ========================================( Modules )======================================== // #
+
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+# // ========================================( Functions )======================================== // #
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, Iterable[str]]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build PEP 562 ``__getattr__`` / ``__dir__`` hooks for a package init.
+
+    ``exports`` maps a module path (relative to ``package``) to the public
+    names it defines. A name's defining module is imported on first
+    attribute access and the value is cached in the package globals, so
+    every later lookup is a plain dict hit that never reaches the hook::
+
+        __getattr__, __dir__ = lazy_exports(__name__, {
+            ".core": ("Theme", "get_theme"),
+        })
+
+    Names not in ``exports`` fall back to importing ``package.name`` as a
+    submodule, so ``import package`` followed by ``package.sub.X`` keeps
+    working the way it did with an eager init. Anything else raises
+    ``AttributeError``.
+    """
+    table = {name: module for module, names in exports.items() for name in names}
+
+    def __getattr__(name: str) -> Any:
+        module_path = table.get(name)
+        if module_path is None:
+            if not name.startswith("__"):
+                try:
+                    return importlib.import_module(f"{package}.{name}")
+                except ModuleNotFoundError as exc:
+                    # Only swallow the miss for this exact submodule; a broken
+                    # import inside a real submodule should still surface.
+                    if exc.name != f"{package}.{name}":
+                        raise
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_path, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        namespace = vars(sys.modules[package])
+        return sorted(set(namespace) | set(namespace.get("__all__", ())) | set(table))
+
+    return __getattr__, __dir__
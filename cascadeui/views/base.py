@@ -20,6 +20,8 @@ from ..exceptions import InstanceLimitError
 from ..state.actions import ActionCreators
 from ..state.singleton import get_store
 from ..state.store import _CURRENT_INTERACTION
+from ..theming.context import _current_theme, set_current_theme
+from ..theming.core import Theme, get_default_theme
 from ..utils.coercion import coerce_snowflake_id, coerce_snowflake_id_set
 from ..utils.errors import safe_execute, with_error_boundary
 from ..utils.tasks import get_task_manager
@@ -408,8 +410,6 @@ class _StatefulMixin(_InteractionMixin, _NavigationMixin):
         if name == "theme":
             if value is None:
                 return
-            from ..theming.core import Theme
-
             if not isinstance(value, Theme):
                 raise TypeError(
                     f"{cls.__name__}.theme must be a Theme instance or None, "
@@ -613,8 +613,6 @@ class _StatefulMixin(_InteractionMixin, _NavigationMixin):
 
                 @functools.wraps(original_build)
                 async def _themed_build_ui(self, *args, **kw):
-                    from ..theming.context import _current_theme, set_current_theme
-
                     token = set_current_theme(self.get_theme())
                     try:
                         result = await original_build(self, *args, **kw)
@@ -627,8 +625,6 @@ class _StatefulMixin(_InteractionMixin, _NavigationMixin):
 
                 @functools.wraps(original_build)
                 def _themed_build_ui(self, *args, **kw):
-                    from ..theming.context import _current_theme, set_current_theme
-
                     token = set_current_theme(self.get_theme())
                     try:
                         result = original_build(self, *args, **kw)
@@ -1183,8 +1179,6 @@ class _StatefulMixin(_InteractionMixin, _NavigationMixin):
         """
         if self.theme is not None:
             return self.theme
-        from ..theming.core import Theme, get_default_theme
-
         return get_default_theme() or Theme("fallback")
 
     # // ==================( Interaction Hooks )================== // #
@@ -1697,7 +1691,8 @@ class _StatefulMixin(_InteractionMixin, _NavigationMixin):
         button and leave the user with no recovery path once the
         interaction token expires.
         """
-        logger.debug(f"View '{self.id}' received state update for action '{action['type']}'")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"View '{self.id}' received state update for action '{action['type']}'")
 
         if self._refresh_armed:
             return
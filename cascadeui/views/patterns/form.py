@@ -2,7 +2,8 @@
 
 
 import logging
-from typing import Any, ClassVar, Dict, List, Optional
+from datetime import date as _date
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple
 
 import discord
 from discord import Interaction
@@ -13,6 +14,7 @@ from ...components.inputs import Modal as CascadeModal
 from ...components.inputs import TextInput as CascadeTextInput
 from ...components.patterns.v2 import alert, card
 from ...components.types import EmojiInput
+from ...validation import validate_fields
 from ..base import _StatefulMixin
 from ..layout import StatefulLayoutView
 from ..view import StatefulView
@@ -37,6 +39,10 @@ _REQUIRED_MARKER = " \\*"
 # writing to ``form.values``.
 _MODAL_TYPES = frozenset({"text", "integer", "float", "date"})
 
+# Embed tint for V1 forms with outstanding errors. ``Color`` is immutable,
+# so one instance serves every render.
+_ERROR_COLOUR = discord.Color.red()
+
 
 # // ========================================( Module Helpers )======================================== // #
 
@@ -74,6 +80,56 @@ def _resolve_modal_edit_label(override: Optional[str], modal_fields: List[Dict[s
     return "Edit Fields"
 
 
+def _check_numeric_range(field: Dict[str, Any], parsed) -> Tuple[Any, Optional[str]]:
+    """Clamp-check a parsed number against the field's ``min_value`` / ``max_value``."""
+    min_v = field.get("min_value")
+    max_v = field.get("max_value")
+    if min_v is not None and parsed < min_v:
+        return None, f"Must be at least {min_v}."
+    if max_v is not None and parsed > max_v:
+        return None, f"Must be at most {max_v}."
+    return parsed, None
+
+
+def _parse_text(field: Dict[str, Any], raw: str) -> Tuple[Any, Optional[str]]:
+    return raw, None
+
+
+def _parse_integer(field: Dict[str, Any], raw: str) -> Tuple[Any, Optional[str]]:
+    try:
+        parsed = int(raw)
+    except ValueError:
+        return None, f"Must be a whole number, got {raw!r}."
+    return _check_numeric_range(field, parsed)
+
+
+def _parse_float(field: Dict[str, Any], raw: str) -> Tuple[Any, Optional[str]]:
+    try:
+        parsed = float(raw)
+    except ValueError:
+        return None, f"Must be a number, got {raw!r}."
+    return _check_numeric_range(field, parsed)
+
+
+def _parse_date(field: Dict[str, Any], raw: str) -> Tuple[Any, Optional[str]]:
+    try:
+        parsed = _date.fromisoformat(raw)
+    except ValueError:
+        return None, f"Must be YYYY-MM-DD, got {raw!r}."
+    return parsed.isoformat(), None
+
+
+# Per-type parser for modal-rendered fields, looked up once per field
+# instead of walking a type if-chain. Types missing from the table pass
+# through as the raw string.
+_FIELD_PARSERS: Dict[str, Callable[[Dict[str, Any], str], Tuple[Any, Optional[str]]]] = {
+    "text": _parse_text,
+    "integer": _parse_integer,
+    "float": _parse_float,
+    "date": _parse_date,
+}
+
+
 def _parse_field_value(field: Dict[str, Any], raw: Optional[str]):
     """Parse a modal input string per field type.
 
@@ -88,53 +144,14 @@ def _parse_field_value(field: Dict[str, Any], raw: Optional[str]):
     canonical ISO string back so values round-trip through persistence
     without a datetime serializer.
     """
-    ftype = field.get("type", "text")
     if raw is None:
         return None, None
     raw = raw.strip()
     if raw == "":
         return None, None
 
-    if ftype == "text":
-        return raw, None
-
-    if ftype == "integer":
-        try:
-            parsed = int(raw)
-        except ValueError:
-            return None, f"Must be a whole number, got {raw!r}."
-        min_v = field.get("min_value")
-        max_v = field.get("max_value")
-        if min_v is not None and parsed < min_v:
-            return None, f"Must be at least {min_v}."
-        if max_v is not None and parsed > max_v:
-            return None, f"Must be at most {max_v}."
-        return parsed, None
-
-    if ftype == "float":
-        try:
-            parsed = float(raw)
-        except ValueError:
-            return None, f"Must be a number, got {raw!r}."
-        min_v = field.get("min_value")
-        max_v = field.get("max_value")
-        if min_v is not None and parsed < min_v:
-            return None, f"Must be at least {min_v}."
-        if max_v is not None and parsed > max_v:
-            return None, f"Must be at most {max_v}."
-        return parsed, None
-
-    if ftype == "date":
-        from datetime import date as _date
-
-        try:
-            parsed = _date.fromisoformat(raw)
-        except ValueError:
-            return None, f"Must be YYYY-MM-DD, got {raw!r}."
-        return parsed.isoformat(), None
-
-    # Any other modal-registered type passes through as a raw string.
-    return raw, None
+    parser = _FIELD_PARSERS.get(field.get("type", "text"), _parse_text)
+    return parser(field, raw)
 
 
 def _build_form_modal(form, title: str) -> CascadeModal:
@@ -223,8 +240,6 @@ def _build_form_modal(form, title: str) -> CascadeModal:
 
         # Run field validators that were originally declared on the fields.
         if field_validators:
-            from ...validation import validate_fields
-
             field_defs = [{"id": fid, "validators": fv} for fid, fv in field_validators.items()]
             errors = await validate_fields(form.values, field_defs)
             if errors:
@@ -455,8 +470,6 @@ class _BaseFormMixin:
 
         has_validators = any(field.get("validators") for field in self.fields)
         if has_validators:
-            from ...validation import validate_fields
-
             errors = await validate_fields(self.values, self.fields)
             if errors:
                 return False, errors
@@ -682,7 +695,7 @@ class FormView(_BaseFormMixin, StatefulView):
         the embed's red-tinted description.
         """
         has_form_error = self._form_error is not None
-        colour = discord.Color.red() if has_form_error or self._field_errors else None
+        colour = _ERROR_COLOUR if has_form_error or self._field_errors else None
         embed = discord.Embed(title=self.title, color=colour)
 
         if has_form_error:
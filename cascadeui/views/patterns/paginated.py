@@ -15,6 +15,22 @@ from ..base import _StatefulMixin
 from ..layout import StatefulLayoutView
 from ..view import StatefulView
 
+# // ========================================( Module Helpers )======================================== // #
+
+
+async def _format_chunks(items: list, per_page: int, formatter: Callable) -> list:
+    """Chunk ``items`` by ``per_page`` and run ``formatter`` over each chunk.
+
+    The sync/async check runs once for the whole batch rather than once per
+    chunk -- ``inspect.iscoroutinefunction`` unwraps partials and decorators
+    on every call, which adds up on large datasets.
+    """
+    chunks = [items[i : i + per_page] for i in range(0, len(items), per_page)]
+    if inspect.iscoroutinefunction(formatter):
+        return [await formatter(chunk) for chunk in chunks]
+    return [formatter(chunk) for chunk in chunks]
+
+
 # // ========================================( Shared Mixin )======================================== // #
 
 
@@ -174,13 +190,7 @@ class _BasePaginatedMixin:
         **kwargs,
     ):
         """Create a paginated view by chunking items and applying a formatter."""
-        chunks = [items[i : i + per_page] for i in range(0, len(items), per_page)]
-        pages = []
-        for chunk in chunks:
-            if inspect.iscoroutinefunction(formatter):
-                pages.append(await formatter(chunk))
-            else:
-                pages.append(formatter(chunk))
+        pages = await _format_chunks(items, per_page, formatter)
         return cls(pages=pages, _per_page=per_page, _formatter=formatter, **kwargs)
 
     @classmethod
@@ -356,13 +366,7 @@ class _BasePaginatedMixin:
         if self._per_page is None or self._formatter is None:
             raise RuntimeError("refresh_data() requires a view created via from_data()")
 
-        chunks = [items[i : i + self._per_page] for i in range(0, len(items), self._per_page)]
-        pages = []
-        for chunk in chunks:
-            if inspect.iscoroutinefunction(self._formatter):
-                pages.append(await self._formatter(chunk))
-            else:
-                pages.append(self._formatter(chunk))
+        pages = await _format_chunks(items, self._per_page, self._formatter)
 
         self.pages = pages or []
         if self.current_page >= len(self.pages):
@@ -6,6 +6,7 @@ import discord
 import pytest
 
 from cascadeui.components.base import StatefulButton, StatefulComponent, StatefulSelect
+from cascadeui.components.patterns import PaginationControls
 from cascadeui.components.v1_composition import (
     CompositeComponent,
     get_component,
@@ -145,6 +146,13 @@ class TestCompositeComponent:
         comp.add_component(btn)
         assert btn in comp.components
 
+    def test_nested_composites_flatten_in_order(self):
+        a, b, c, d = (StatefulButton(label=label) for label in "ABCD")
+        inner = CompositeComponent().add_component(b).add_component(c)
+        outer = CompositeComponent().add_component(a)
+        outer.add_component(CompositeComponent().add_component(inner)).add_component(d)
+        assert outer.create_discord_components() == [a, b, c, d]
+
     def test_register_and_get_component(self):
         register_component("test_comp", CompositeComponent)
         cls = get_component("test_comp")
@@ -154,6 +162,20 @@ class TestCompositeComponent:
         result = get_component("nonexistent_component_xyz")
         assert result is None
 
+    def test_freeze_registry_keeps_lookups_and_blocks_registration(self, monkeypatch):
+        from cascadeui.components import v1_composition
+
+        monkeypatch.setattr(
+            v1_composition, "_component_registry", dict(v1_composition._component_registry)
+        )
+        register_component("frozen_comp", CompositeComponent)
+        v1_composition.freeze_registry()
+
+        assert get_component("frozen_comp") is CompositeComponent
+        assert get_component("toggle_group") is not None
+        with pytest.raises(RuntimeError, match="frozen"):
+            register_component("late_comp", CompositeComponent)
+
 
 class TestStatefulCallbackTokenDiscipline:
     """``_CURRENT_INTERACTION`` resets after ``stateful_callback`` returns,
@@ -344,3 +366,81 @@ class TestButtonOwnerOnly:
 
         assert btn_default._button_owner_only is False
         assert btn_owner._button_owner_only is True
+
+
+class TestPaginationControls:
+    """V1 PaginationControls keeps its indicator and boundary buttons in sync."""
+
+    def test_initial_label_and_boundaries(self):
+        controls = PaginationControls(page_count=3)
+        assert controls.indicator.label == "Page 1/3"
+        assert controls.prev_button.disabled is True
+        assert controls.next_button.disabled is False
+
+    def test_update_buttons_tracks_current_page(self):
+        controls = PaginationControls(page_count=3)
+        controls.current_page = 2
+        controls._update_buttons()
+        assert controls.indicator.label == "Page 3/3"
+        assert controls.next_button.disabled is True
+
+    def test_reassigned_page_count_updates_label(self):
+        controls = PaginationControls(page_count=2)
+        controls.page_count = 5
+        controls.current_page = 3
+        controls._update_buttons()
+        assert controls.indicator.label == "Page 4/5"
+
+    def test_shrunk_page_count_clamps_current_page(self):
+        controls = PaginationControls(page_count=5, current_page=4)
+        controls.page_count = 3
+        controls._update_buttons()
+        assert controls.current_page == 2
+        assert controls.indicator.label == "Page 3/3"
+        assert controls.next_button.disabled is True
+
+
+class TestToggleButtonClass:
+    """ToggleButton flips label/style, dispatches, then runs the user callback."""
+
+    async def test_click_toggles_and_dispatches(self):
+        from cascadeui.components.buttons import ToggleButton
+
+        calls = []
+
+        async def user_cb(interaction):
+            calls.append(btn.is_toggled)
+
+        btn = ToggleButton(label="Notify", callback=user_cb)
+        view = MagicMock()
+        view.id = "view-1"
+        view.dispatch = AsyncMock()
+        interaction = MagicMock()
+        interaction.user.id = 42
+
+        with patch.object(ToggleButton, "view", new=view):
+            await btn.callback(interaction)
+
+        assert btn.is_toggled is True
+        assert btn.label == "Notify ✓"
+        assert btn.style == discord.ButtonStyle.success
+        assert calls == [True]
+        action_type, payload = view.dispatch.await_args.args
+        assert action_type == "COMPONENT_INTERACTION"
+        assert payload["value"] == {"value": True}
+        assert payload["user_id"] == 42
+
+    async def test_second_click_restores_original_state(self):
+        from cascadeui.components.buttons import ToggleButton
+
+        btn = ToggleButton(label="Notify", toggled=True)
+        interaction = MagicMock()
+        interaction.response.is_done.return_value = False
+        interaction.response.defer = AsyncMock()
+
+        await btn.callback(interaction)
+
+        assert btn.is_toggled is False
+        assert btn.label == "Notify"
+        assert btn.style == discord.ButtonStyle.secondary
+        interaction.response.defer.assert_awaited_once()
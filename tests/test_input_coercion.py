@@ -46,6 +46,12 @@ class TestCoerceSnowflakeId:
     def test_member_shaped_object(self):
         assert coerce_snowflake_id(_snowflake(123456789)) == 123456789
 
+    def test_int_subclass_passthrough(self):
+        class _Id(int):
+            pass
+
+        assert coerce_snowflake_id(_Id(7)) == 7
+
     def test_rejects_string(self):
         with pytest.raises(TypeError, match="Snowflake"):
             coerce_snowflake_id("123")
@@ -51,6 +51,15 @@ class TestTextInputSlug:
         assert TextInput._slug("A/B Test!") == f"input_{slugify('A/B Test!')}"
 
 
+class TestTextInputAttributes:
+    """TextInput keeps a ``__dict__`` alongside its slots."""
+
+    def test_accepts_caller_attributes(self):
+        field = TextInput(label="Username")
+        field.note = "kept"
+        assert field.note == "kept"
+
+
 # // ========================================( TextInput.validators )======================================== // #
 
 
@@ -708,3 +717,28 @@ class TestModalDuplicateInputs:
     def test_distinct_labels_pass(self):
         modal = Modal(title="T", inputs=[TextInput(label="Name"), TextInput(label="Email")])
         assert len(modal.inputs) == 2
+
+
+class TestSubmittedValueGetter:
+    """Modal child types map to the attribute carrying the submitted value."""
+
+    def test_single_and_multi_value_types(self):
+        from cascadeui.components.inputs import _submitted_value_getter
+
+        text = discord.ui.TextInput(label="T", custom_id="t")
+        text._value = "hello"
+        assert _submitted_value_getter(discord.ui.TextInput)(text) == "hello"
+        assert _submitted_value_getter(discord.ui.FileUpload) is not None
+
+    def test_subclass_resolves_through_base(self):
+        from cascadeui.components.inputs import _SUBMITTED_VALUE_GETTERS, _submitted_value_getter
+
+        class MyInput(discord.ui.TextInput):
+            pass
+
+        assert _submitted_value_getter(MyInput) is _SUBMITTED_VALUE_GETTERS[discord.ui.TextInput]
+
+    def test_non_input_type_has_no_getter(self):
+        from cascadeui.components.inputs import _submitted_value_getter
+
+        assert _submitted_value_getter(discord.ui.TextDisplay) is None
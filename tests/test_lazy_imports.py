@@ -0,0 +1,97 @@
+"""Guard the lazy package inits against silently turning eager again.
+
+Each check runs in a fresh interpreter so modules already imported by the
+rest of the suite cannot mask a regression.
+"""
+
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+
+def _run(code: str) -> None:
+    result = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+
+
+# // ========================================( Import Laziness )======================================== // #
+
+
+class TestImportLaziness:
+    """``import cascadeui`` and narrow imports only load what they use."""
+
+    def test_bare_import_loads_no_subsystems(self):
+        _run("""
+            import sys
+            import cascadeui
+
+            loaded = sorted(m for m in sys.modules if m.startswith("cascadeui"))
+            assert "discord" not in sys.modules, loaded
+            assert len(loaded) <= 3, loaded
+            """)
+
+    def test_button_import_skips_selects_inputs_and_patterns(self):
+        _run("""
+            import sys
+            from cascadeui.components import PrimaryButton
+
+            for name in ("selects", "inputs", "patterns", "wrappers"):
+                assert f"cascadeui.components.{name}" not in sys.modules, name
+            """)
+
+    def test_theme_import_defers_builtin_themes(self):
+        _run("""
+            import sys
+            from cascadeui import Theme
+
+            assert "cascadeui.theming.themes" not in sys.modules
+            from cascadeui import get_default_theme
+
+            assert get_default_theme().name == "default"
+            """)
+
+    def test_store_import_skips_persistence(self):
+        _run("""
+            import sys
+            from cascadeui.state.store import StateStore
+
+            loaded = [m for m in sys.modules if "persistence" in m]
+            assert not loaded, loaded
+            from cascadeui.state import PersistenceMiddleware
+
+            assert PersistenceMiddleware.__name__ == "PersistenceMiddleware"
+            """)
+
+    def test_exports_resolve_and_star_import_works(self):
+        _run("""
+            import cascadeui
+
+            missing = [name for name in cascadeui.__all__ if not hasattr(cascadeui, name)]
+            assert not missing, missing
+            assert set(cascadeui.__all__) <= set(dir(cascadeui))
+
+            namespace = {}
+            exec("from cascadeui import *", namespace)
+            assert "StatefulView" in namespace
+            """)
+
+    def test_subpackages_resolve_as_attributes(self):
+        _run("""
+            import cascadeui
+
+            for name in ("state", "theming", "components", "persistence", "views"):
+                assert getattr(cascadeui, name).__name__ == f"cascadeui.{name}", name
+            assert cascadeui.theming.core.Theme is cascadeui.Theme
+            """)
+
+    def test_unknown_attribute_raises(self):
+        import cascadeui
+
+        with pytest.raises(AttributeError):
+            cascadeui.definitely_not_exported
@@ -102,6 +102,23 @@ class TestSingleMessageDelete:
 
         view.exit.assert_not_awaited()
 
+    async def test_hook_may_unregister_during_cleanup(self):
+        """The scan finishes before the hook runs, so unregistering is safe."""
+        store = StateStore()
+        bot = _make_bot()
+        store._install_message_cleanup(bot)
+        view = _make_view(store, message_id=555)
+        _make_view(store, message_id=556, user_id=101)
+
+        async def _exit(**kwargs):
+            store._unregister_view(view.id)
+
+        view.exit = AsyncMock(side_effect=_exit)
+
+        await bot._listeners["on_raw_message_delete"](MagicMock(message_id=555))
+
+        assert view.id not in store.get_active_views()
+
     async def test_view_without_message_skipped(self):
         store = StateStore()
         bot = _make_bot()
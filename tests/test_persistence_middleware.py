@@ -485,6 +485,31 @@ class TestMiddlewareDebounce:
         assert len(rows) == 1
         assert json.loads(rows[0]["payload"]) == {"n": 3}
 
+    async def test_burst_reuses_one_timer_task(self):
+        middleware, mgr, backend = await _make_middleware()
+        ns = middleware._ns_application
+        ns.interval = 0.05
+        ns.max_age = 1.0
+        ns.dirty_rows["pref"] = {
+            "slot_name": "pref",
+            "payload": "{}",
+            "schema_version": 1,
+            "updated_at": 1,
+            "expires_at": None,
+        }
+
+        middleware._schedule(ns)
+        timer = ns.task
+        for _ in range(5):
+            middleware._schedule(ns)
+        assert ns.task is timer
+        assert not timer.cancelled()
+
+        await timer
+        assert ns.task is None
+        rows = await backend.row_select(TABLE_APPLICATION_SLOTS)
+        assert len(rows) == 1
+
     async def test_max_age_ceiling_fires_under_steady_traffic(self):
         middleware, mgr, backend = await _make_middleware()
         # Keep resetting the idle window every 20ms, but the ceiling
@@ -566,6 +591,42 @@ class TestMiddlewareRetryBackoff:
         middleware._ns_application.deleted_keys.clear()
         await middleware.close()
 
+    async def test_pending_retry_does_not_block_debounce(self):
+        middleware, mgr, backend = await _make_middleware()
+        ns = middleware._ns_application
+        ns.interval = 0.01
+        ns.max_age = 0.02
+
+        def dirty(name):
+            ns.dirty_rows[name] = {
+                "slot_name": name,
+                "payload": "{}",
+                "schema_version": 1,
+                "updated_at": 1,
+                "expires_at": None,
+            }
+
+        async def failing(*args, **kwargs):
+            raise RuntimeError("simulated backend failure")
+
+        original_many = backend.row_upsert_many
+        backend.row_upsert_many = failing  # type: ignore[method-assign]
+        dirty("first")
+        await middleware._flush(ns)
+        assert ns.retry_task is not None and not ns.retry_task.done()
+        backend.row_upsert_many = original_many  # type: ignore[method-assign]
+
+        # A write during the backoff window still gets its own debounce
+        # timer instead of waiting out the retry.
+        dirty("second")
+        middleware._schedule(ns)
+        assert ns.task is not ns.retry_task
+        await ns.task
+
+        rows = await backend.row_select(TABLE_APPLICATION_SLOTS)
+        assert sorted(row["slot_name"] for row in rows) == ["first", "second"]
+        await middleware.close()
+
     async def test_max_retries_resets_counter(self):
         middleware, mgr, backend = await _make_middleware()
         ns = middleware._ns_application
@@ -777,6 +838,62 @@ class TestMiddlewareShutdown:
         rows = await backend.row_select(TABLE_APPLICATION_SLOTS)
         assert len(rows) == 1
 
+    async def test_flush_all_does_not_strand_later_writes(self):
+        # flush_all runs mid-life (devtools flush, inspector button), and
+        # may cancel a timer before its first step. The next debounced
+        # write must still arm a fresh timer and land.
+        middleware, mgr, backend = await _make_middleware()
+        ns = middleware._ns_application
+        ns.interval = 0.01
+        ns.max_age = 0.02
+
+        def dirty(name):
+            ns.dirty_rows[name] = {
+                "slot_name": name,
+                "payload": "{}",
+                "schema_version": 1,
+                "updated_at": 1,
+                "expires_at": None,
+            }
+
+        dirty("first")
+        middleware._schedule(ns)
+        await middleware.flush_all()
+
+        dirty("second")
+        middleware._schedule(ns)
+        await asyncio.sleep(0.05)
+        await _drain(middleware)
+
+        rows = await backend.row_select(TABLE_APPLICATION_SLOTS)
+        assert sorted(row["slot_name"] for row in rows) == ["first", "second"]
+
+    async def test_flush_all_finishes_every_drain_when_one_raises(self, caplog):
+        middleware, mgr, backend = await _make_middleware()
+        middleware._ns_registry.dirty_rows["broken"] = {"persistence_key": "broken"}
+        middleware._ns_application.dirty_rows["pref"] = {
+            "slot_name": "pref",
+            "payload": "{}",
+            "schema_version": 1,
+            "updated_at": 1,
+            "expires_at": None,
+        }
+        real_tables = middleware._namespace_tables
+
+        def tables(name):
+            if name == "registry":
+                raise RuntimeError("registry table lookup failed")
+            return real_tables(name)
+
+        middleware._namespace_tables = tables
+
+        with caplog.at_level("ERROR"):
+            await middleware.flush_all()
+
+        rows = await backend.row_select(TABLE_APPLICATION_SLOTS)
+        assert len(rows) == 1
+        assert "registry table lookup failed" in caplog.text
+
     async def test_close_blocks_further_routing(self):
         middleware, mgr, backend = await _make_middleware()
         await middleware.close()
@@ -240,6 +240,17 @@ class TestDispatch:
 
         assert len(store.history) == 5
 
+    async def test_lowering_history_limit_keeps_newest(self):
+        store = get_store()
+        for i in range(6):
+            await store.dispatch("FILL_ACTION", {"i": i})
+
+        store.history_limit = 2
+
+        assert [a["payload"]["i"] for a in store.history] == [4, 5]
+        store.history = [{"type": "A"}, {"type": "B"}, {"type": "C"}]
+        assert [a["type"] for a in store.history] == ["B", "C"]
+
 
 class TestSubscribers:
     """Subscriber registration, notification, action filtering, and unsubscribe."""
@@ -480,6 +491,11 @@ class TestReducers:
         store._unregister_reducer("TEMP")
         assert "TEMP" not in store.reducers
 
+    def test_core_reducers_loaded_at_construction(self):
+        store = get_store()
+        assert "VIEW_CREATED" in store.reducers
+        assert store.reducers.keys() >= store._core_reducers.keys()
+
     async def test_custom_reducer_overrides_core(self):
         store = get_store()
         store._load_core_reducers()
@@ -610,6 +626,18 @@ class TestCascadeReducerCollision:
         assert store.reducers["VIEW_UPDATED"] is _override
         store._unregister_reducer("VIEW_UPDATED")
 
+    def test_unregister_override_restores_core_reducer(self):
+        store = get_store()
+        store._load_core_reducers()
+        core = store.reducers["VIEW_UPDATED"]
+
+        async def _override(action, state):
+            return state
+
+        store._register_reducer("VIEW_UPDATED", _override)
+        store._unregister_reducer("VIEW_UPDATED")
+        assert store.reducers["VIEW_UPDATED"] is core
+
 
 class TestInspectorPurgedStaleReducer:
     """INSPECTOR_PURGED_STALE keeps the inspector's own entries and drops everything else."""
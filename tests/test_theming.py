@@ -20,6 +20,9 @@ def reset_themes():
     """Reset the global theme registry between tests."""
     from cascadeui.theming import core
 
+    # Mark the built-ins as loaded so the first registry call inside a test
+    # does not re-populate the cleared registry.
+    core._builtin_themes_loaded = True
     core._themes.clear()
     core._default_theme = None
     yield
@@ -49,6 +52,19 @@ class TestTheme:
         t = Theme("test")
         assert t.get_style("nonexistent", "fallback") == "fallback"
 
+    def test_apply_helpers_route_through_get_style(self):
+        class GreenTheme(Theme):
+            def get_style(self, key, default=None):
+                if key in ("primary_color", "accent_colour"):
+                    return discord.Color.green()
+                return super().get_style(key, default)
+
+        t = GreenTheme("green")
+        embed = t.apply_to_embed(discord.Embed(title="Hello"))
+        assert embed.color == discord.Color.green()
+        container = t.apply_to_container(discord.ui.Container())
+        assert container.accent_colour == discord.Color.green()
+
 
 class TestThemeRegistry:
     """Global theme registry: register, retrieve, and set default theme."""
@@ -95,6 +95,32 @@ class TestWithLoadingState:
 
         interaction.response.edit_message.assert_called_once()
 
+    async def test_restore_reuses_interaction_webhook_after_response_edit(self):
+        """Plain-view path: the restore edits the original response, not the channel message."""
+        component = _make_button()
+        with_loading_state(component)
+        interaction = make_interaction(is_done=False)
+        interaction.message = MagicMock()
+        interaction.message.edit = AsyncMock()
+
+        await component.callback(interaction)
+
+        interaction.edit_original_response.assert_awaited_once_with(view=component.view)
+        interaction.message.edit.assert_not_called()
+
+    async def test_restore_swallows_http_errors(self):
+        """A failed restore edit (message deleted mid-callback) does not raise."""
+        component = _make_button()
+        with_loading_state(component)
+        interaction = make_interaction(is_done=False)
+        interaction.edit_original_response = AsyncMock(
+            side_effect=discord.NotFound(MagicMock(status=404), "Unknown Message")
+        )
+
+        await component.callback(interaction)
+
+        assert component.disabled is False
+
     async def test_falls_back_when_already_deferred(self):
         """Plain-view path: should fall back to message.edit when interaction is already responded."""
         component = _make_button()
@@ -321,6 +347,20 @@ class TestWithConfirmation:
         assert call_kwargs["ephemeral"] is True
         assert call_kwargs["embed"].title == "Delete?"
 
+    async def test_prompt_embed_built_once_per_wrapper(self):
+        """Repeated triggers reuse the wrapper's prebuilt embed."""
+        component = _make_button(callback=AsyncMock())
+        with_confirmation(component, title="Delete?", message="This is permanent.")
+        first, second = make_interaction(), make_interaction()
+
+        await component.callback(first)
+        await component.callback(second)
+
+        first_embed = first.response.send_message.call_args[1]["embed"]
+        second_embed = second.response.send_message.call_args[1]["embed"]
+        assert first_embed is second_embed
+        assert first_embed.description == "This is permanent."
+
     async def test_does_not_call_original_before_confirm(self):
         """Original callback should not fire until confirm button is clicked."""
         original = AsyncMock()